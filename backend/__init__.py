@@ -1,12 +1,30 @@
 """Archy: A backend toolkit for causal AI concepts."""
 
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.5"
 
-from backend.counterfactuals import StructuralCausalModel, StructuralEquation
-from backend.do_calculus import DoCalculus
-from backend.graph import CausalGraph
-from backend.interventions import IntervenedGraph, Intervention
-from backend.rendering import render_graph_ascii
+if TYPE_CHECKING:
+    from backend.counterfactuals import StructuralCausalModel, StructuralEquation
+    from backend.do_calculus import DoCalculus
+    from backend.graph import CausalGraph
+    from backend.interventions import IntervenedGraph, Intervention
+    from backend.rendering import render_graph_ascii
+
+# Public names are imported on first access, so that e.g. the CLI can use
+# CausalGraph without paying for pydantic model creation in counterfactuals.
+_EXPORTS = {
+    "CausalGraph": "backend.graph",
+    "DoCalculus": "backend.do_calculus",
+    "IntervenedGraph": "backend.interventions",
+    "Intervention": "backend.interventions",
+    "StructuralCausalModel": "backend.counterfactuals",
+    "StructuralEquation": "backend.counterfactuals",
+    "render_graph_ascii": "backend.rendering",
+}
 
 __all__ = [
     "CausalGraph",
@@ -17,3 +35,11 @@ __all__ = [
     "StructuralEquation",
     "render_graph_ascii",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
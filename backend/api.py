@@ -83,6 +83,9 @@ class CausalAIService:
     """Main service class for causal AI operations.
 
     This provides a unified API that can be used by a UI frontend.
+
+    Responses are built from already-typed internal values, so they are
+    created with ``model_construct`` and skip Pydantic validation.
     """
 
     graph: Optional[CausalGraph]
@@ -107,13 +110,15 @@ class CausalAIService:
         try:
             self.graph = CausalGraph(edges=request.edges)
             self.do_calculus = DoCalculus(self.graph)
-            return GraphResponse(
+            return GraphResponse.model_construct(
                 nodes=self.graph.get_nodes(),
                 edges=self.graph.get_edges(),
                 message="Graph created successfully",
             )
         except ValueError as e:
-            return GraphResponse(nodes=[], edges=[], message=f"Error: {str(e)}")
+            return GraphResponse.model_construct(
+                nodes=[], edges=[], message=f"Error: {str(e)}"
+            )
 
     def apply_intervention(self, request: InterventionRequest) -> InterventionResponse:
         """Apply an intervention to the graph.
@@ -125,15 +130,15 @@ class CausalAIService:
             Information about the intervened graph
         """
         if not self.graph:
-            return InterventionResponse(
+            return InterventionResponse.model_construct(
                 intervened_nodes=[],
                 remaining_edges=[],
                 message="No graph available. Create a graph first.",
             )
 
-        intervened_graph = IntervenedGraph(self.graph, {request.variable})
+        intervened_graph = IntervenedGraph.get(self.graph, {request.variable})
 
-        return InterventionResponse(
+        return InterventionResponse.model_construct(
             intervened_nodes=list(intervened_graph.interventions),
             remaining_edges=intervened_graph.get_edges(),
             message=f"Intervention do({request.variable}) applied",
@@ -149,13 +154,14 @@ class CausalAIService:
             Whether the rule applies
         """
         if not self.do_calculus:
-            return DoCalculusResponse(
+            return DoCalculusResponse.model_construct(
                 applicable=False, message="No graph available. Create a graph first."
             )
 
-        outcome = set(request.outcome)
-        intervention = set(request.intervention)
-        conditioning = set(request.conditioning) if request.conditioning else set()
+        # Frozen once so DoCalculus can reuse its cached subgraphs across rules
+        outcome = frozenset(request.outcome)
+        intervention = frozenset(request.intervention)
+        conditioning = frozenset(request.conditioning or ())
 
         applicable = False
         rule_name = ""
@@ -176,11 +182,11 @@ class CausalAIService:
             )
             rule_name = "Rule 3 (Insertion/deletion of actions)"
         else:
-            return DoCalculusResponse(
+            return DoCalculusResponse.model_construct(
                 applicable=False, message="Please specify rule 1, 2, or 3"
             )
 
-        return DoCalculusResponse(
+        return DoCalculusResponse.model_construct(
             applicable=applicable,
             message=f"{rule_name}: {'Applies' if applicable else 'Does not apply'}",
         )
@@ -197,7 +203,7 @@ class CausalAIService:
             Counterfactual value
         """
         if not self.scm:
-            return CounterfactualResponse(
+            return CounterfactualResponse.model_construct(
                 value=0.0,
                 message="No structural causal model available. Add equations first.",
             )
@@ -208,11 +214,11 @@ class CausalAIService:
                 factual_evidence=request.factual_evidence,
                 query_variable=request.query_variable,
             )
-            return CounterfactualResponse(
-                value=value, message="Counterfactual computed successfully"
+            return CounterfactualResponse.model_construct(
+                value=float(value), message="Counterfactual computed successfully"
             )
         except Exception as e:
-            return CounterfactualResponse(
+            return CounterfactualResponse.model_construct(
                 value=0.0, message=f"Error computing counterfactual: {str(e)}"
             )
 
@@ -1,5 +1,34 @@
 """Archy CLI - Unix-style causal AI toolkit."""
 
-from backend.cli.main import cli
+from __future__ import annotations
 
-__all__ = ["cli"]
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from backend.cli.main import cli
+
+__all__ = ["cli", "main"]
+
+
+def main() -> None:
+    """Console entry point.
+
+    Plain invocations of the pipe commands run without importing Click;
+    everything else (help, ``learn``, ``examples``, errors) goes through the
+    Click group.
+    """
+    from backend.cli.commands import run_fast
+
+    if not run_fast(sys.argv[1:]):
+        from backend.cli.main import cli
+
+        cli()
+
+
+def __getattr__(name: str) -> Any:
+    if name == "cli":
+        from backend.cli.main import cli
+
+        return cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,443 @@
+"""Implementations of the graph commands, independent of Click.
+
+The Click commands in ``backend.cli.main`` delegate here, and ``run_fast``
+calls the same functions directly for plain invocations of the pipe commands
+(``graph``, ``do``, ``info``, ``dsep``, ``paths``), so those skip importing
+Click and building the command group.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+from collections.abc import Sequence
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any, Self, TextIO
+
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+from backend import CausalGraph
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from rich.console import Console
+
+
+class _LazyConsole:
+    """Rich console that is only imported and created on first use.
+
+    JSON-only pipe stages (e.g. `archy graph ... --json`) never print through
+    Rich, so they skip its import cost entirely. When the stream is not a
+    terminal, plain strings skip Rich as well: Rich would drop their styling
+    anyway, so the markup is stripped and the text written directly. Tables
+    and trees still go through Rich for their layout.
+
+    Used as a context manager, it buffers everything printed inside the block
+    and writes it in one go on exit, instead of issuing a write per print.
+    """
+
+    def __init__(self, stderr: bool = False) -> None:
+        self._stderr = stderr
+        self._console: Console | None = None
+        self._depth = 0
+        self._buffer: list[str] = []
+
+    def _stream(self) -> TextIO:
+        return sys.stderr if self._stderr else sys.stdout
+
+    def _get(self) -> Console:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(stderr=self._stderr)
+        return self._console
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get(), name)
+
+    def print(self, *objects: Any, **kwargs: Any) -> None:
+        """Print like ``rich.console.Console.print``."""
+        if not self._stream().isatty() and all(isinstance(o, str) for o in objects):
+            self._write(" ".join(_MARKUP_TAG.sub("", o) for o in objects) + "\n")
+        elif self._depth:
+            rich_console = self._get()
+            with rich_console.capture() as capture:
+                rich_console.print(*objects, **kwargs)
+            self._write(capture.get())
+        else:
+            self._get().print(*objects, **kwargs)
+
+    def _write(self, text: str) -> None:
+        if self._depth:
+            self._buffer.append(text)
+        else:
+            self._stream().write(text)
+
+    def __enter__(self) -> Self:
+        self._depth += 1
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._depth -= 1
+        if not self._depth and self._buffer:
+            stream = self._stream()
+            stream.write("".join(self._buffer))
+            stream.flush()
+            self._buffer.clear()
+
+
+# The Rich style tags used in this package's messages
+_MARKUP_TAG = re.compile(r"\[/?(?:bold|dim|red|green|yellow|cyan| )+\]")
+
+console = _LazyConsole()
+err_console = _LazyConsole(stderr=True)
+
+
+def read_graph_from_stdin() -> dict | None:
+    """Read graph JSON from stdin if available."""
+    if not sys.stdin.isatty():
+        try:
+            if orjson is not None:
+                return orjson.loads(sys.stdin.buffer.read())
+            return json.load(sys.stdin)
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
+            return None
+    return None
+
+
+def write_graph_to_stdout(graph: CausalGraph) -> None:
+    """Write graph as JSON to stdout."""
+    if orjson is not None:
+        # Write the encoded bytes directly, skipping click's str round-trip
+        sys.stdout.buffer.write(orjson.dumps(graph.to_dict()) + b"\n")
+        sys.stdout.flush()
+    else:
+        sys.stdout.write(json.dumps(graph.to_dict()) + "\n")
+
+
+def run_graph(
+    edges: Sequence[Sequence[str]],
+    chains: Sequence[str],
+    nodes: Sequence[str],
+    as_json: bool,
+    extra_args: Sequence[str],
+) -> None:
+    """Create a causal graph and print it or write it as JSON."""
+    # Check for common mistake: unquoted chain arguments
+    if extra_args and chains:
+        err_console.print(
+            f"[red]Error:[/red] Unexpected arguments: {' '.join(extra_args)}\n"
+        )
+        err_console.print(
+            "[yellow]Hint:[/yellow] The -c/--chain option requires quotes around the node list:"
+        )
+        err_console.print(
+            f'  [green]archy graph -c "{chains[0]} {" ".join(extra_args)}"[/green]\n'
+        )
+        sys.exit(1)
+    elif extra_args:
+        err_console.print(
+            f"[red]Error:[/red] Unexpected arguments: {' '.join(extra_args)}\n"
+        )
+        err_console.print("Use -e for edges or -c for chains. See 'archy graph --help'")
+        sys.exit(1)
+
+    edge_list = [(e[0], e[1]) for e in edges]
+
+    # Parse chains into edges
+    for chain in chains:
+        chain_nodes = chain.split()
+        if len(chain_nodes) < 2:
+            err_console.print(
+                f"[red]Error:[/red] Chain '{chain}' needs at least 2 nodes.\n"
+            )
+            err_console.print(
+                "[yellow]Hint:[/yellow] Use quotes around multiple nodes:"
+            )
+            err_console.print('  [green]archy graph -c "A B C"[/green]')
+            sys.exit(1)
+        edge_list.extend(pairwise(chain_nodes))
+
+    try:
+        g = CausalGraph(edges=edge_list if edge_list else None)
+        for node in nodes:
+            g.add_node(node)  # No-op for nodes the edges already added
+    except ValueError as e:
+        err_console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+    if as_json:
+        write_graph_to_stdout(g)
+    else:
+        _print_graph_visual(g)
+
+
+def run_do(variables: Sequence[str], as_json: bool) -> None:
+    """Apply a do-intervention to the graph read from stdin."""
+    data = read_graph_from_stdin()
+    if not data:
+        err_console.print(
+            "[red]Error:[/red] No graph provided. Pipe a graph to this command."
+        )
+        sys.exit(1)
+
+    if not variables:
+        err_console.print(
+            "[red]Error:[/red] Specify at least one variable to intervene on."
+        )
+        sys.exit(1)
+
+    from backend.interventions import IntervenedGraph
+
+    try:
+        g = CausalGraph.from_dict(data)
+        intervened = IntervenedGraph(g, set(variables))
+
+        result = intervened.to_causal_graph()
+
+    except ValueError as e:
+        err_console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+    if as_json:
+        write_graph_to_stdout(result)
+    else:
+        var_str = ", ".join(variables)
+        with console:
+            console.print(f"[bold]After do({var_str}):[/bold]")
+            _print_graph_visual(result)
+
+
+def run_info() -> None:
+    """Display information about the graph read from stdin."""
+    data = read_graph_from_stdin()
+    if not data:
+        err_console.print(
+            "[red]Error:[/red] No graph provided. Pipe a graph to this command."
+        )
+        sys.exit(1)
+
+    try:
+        g = CausalGraph.from_dict(data)
+    except ValueError as e:
+        err_console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+    _print_graph_info(g)
+
+
+def run_dsep(x: str, y: str, given: Sequence[str]) -> None:
+    """Check d-separation of X and Y given Z in the graph read from stdin."""
+    data = read_graph_from_stdin()
+    if not data:
+        err_console.print(
+            "[red]Error:[/red] No graph provided. Pipe a graph to this command."
+        )
+        sys.exit(1)
+
+    try:
+        g = CausalGraph.from_dict(data)
+        result = g.is_d_separated({x}, {y}, set(given))
+    except Exception as e:
+        err_console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+    given_str = f" | {', '.join(given)}" if given else ""
+    symbol = "⫫" if result else "⫫̸"
+    status = "[green]Yes[/green]" if result else "[red]No[/red]"
+
+    console.print(f"{x} {symbol} {y}{given_str}: {status}")
+
+
+def run_paths(treatment: str, outcome: str) -> None:
+    """Print the backdoor paths in the graph read from stdin."""
+    data = read_graph_from_stdin()
+    if not data:
+        err_console.print(
+            "[red]Error:[/red] No graph provided. Pipe a graph to this command."
+        )
+        sys.exit(1)
+
+    try:
+        g = CausalGraph.from_dict(data)
+        backdoor = g.get_backdoor_paths(treatment, outcome)
+    except Exception as e:
+        err_console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+    with console:
+        console.print(f"[bold]Backdoor paths from {treatment} to {outcome}:[/bold]")
+        if backdoor:
+            for path in backdoor:
+                console.print(f"  [yellow]{'[/yellow] → [yellow]'.join(path)}[/yellow]")
+        else:
+            console.print("  [green]None (no confounding)[/green]")
+
+
+def _print_graph_visual(g: CausalGraph) -> None:
+    """Print a visual representation of the graph."""
+    from rich.tree import Tree
+
+    nodes = g.get_nodes()
+    edges = g.get_edges()
+
+    if not nodes:
+        console.print("[dim]Empty graph[/dim]")
+        return
+
+    # Read neighbours straight from the networkx adjacency, without
+    # building per-node sets
+    parents = g._graph.pred
+    children = g._graph.succ
+
+    tree = Tree("[bold]Causal Graph[/bold]")
+
+    # Show edges
+    edge_str = ", ".join(f"{p}→{c}" for p, c in edges) if edges else "none"
+    tree.add(f"[dim]Edges:[/dim] {edge_str}")
+
+    # Show nodes with their relationships
+    for node in sorted(nodes):
+        node_parents = parents[node]
+        node_children = children[node]
+        parent_str = f" ← {{{', '.join(sorted(node_parents))}}}" if node_parents else ""
+        child_str = (
+            f" → {{{', '.join(sorted(node_children))}}}" if node_children else ""
+        )
+        tree.add(f"[cyan]{node}[/cyan]{parent_str}{child_str}")
+
+    console.print(tree)
+
+
+def _print_graph_info(g: CausalGraph) -> None:
+    """Print detailed graph information."""
+    from rich.table import Table
+
+    nodes = g.get_nodes()
+    edges = g.get_edges()
+
+    table = Table(title="Graph Information")
+    table.add_column("Property", style="bold")
+    table.add_column("Value")
+
+    table.add_row("Nodes", str(len(nodes)))
+    table.add_row("Edges", str(len(edges)))
+    table.add_row("Node list", ", ".join(sorted(nodes)) if nodes else "-")
+
+    # Find roots and leaves from the networkx adjacency
+    pred = g._graph.pred
+    succ = g._graph.succ
+    roots = [n for n in nodes if not pred[n]]
+    leaves = [n for n in nodes if not succ[n]]
+
+    table.add_row("Roots (no parents)", ", ".join(sorted(roots)) if roots else "-")
+    table.add_row("Leaves (no children)", ", ".join(sorted(leaves)) if leaves else "-")
+
+    with console:
+        console.print(table)
+
+        # Edge list
+        if edges:
+            console.print("\n[bold]Edges:[/bold]")
+            for parent, child in edges:
+                console.print(f"  {parent} → {child}")
+
+
+def run_fast(args: Sequence[str]) -> bool:
+    """Run a pipe command directly from its arguments, bypassing Click.
+
+    Only plain invocations are handled: any help or version flag, unknown
+    option, or malformed argument list returns False, so the caller can fall
+    back to the Click group and get its usual parsing and error messages.
+
+    Args:
+        args: Command-line arguments without the program name
+
+    Returns:
+        True if the command was run, False if Click should handle it
+    """
+    if not args:
+        return False
+    command, rest = args[0], args[1:]
+    arity = _FAST_COMMANDS.get(command)
+    if arity is None:
+        return False
+
+    options: dict[str, list[str]] = {}
+    positional: list[str] = []
+
+    i = 0
+    while i < len(rest):
+        arg = rest[i]
+        if arg.startswith("-") and arg != "-":
+            name = _FAST_ALIASES.get(arg)
+            if name is None or name not in arity:
+                return False
+            nargs = arity[name]
+            values = rest[i + 1 : i + 1 + nargs]
+            if len(values) < nargs:
+                return False
+            options.setdefault(name, []).extend(values)
+            i += 1 + nargs
+        else:
+            positional.append(arg)
+            i += 1
+
+    as_json = "json" in options
+    if command == "graph":
+        edge_values = options.get("edge", [])
+        run_graph(
+            list(zip(edge_values[::2], edge_values[1::2])),
+            options.get("chain", []),
+            options.get("node", []),
+            as_json,
+            positional,
+        )
+    elif command == "do":
+        run_do(positional, as_json)
+    elif command == "info":
+        if positional:
+            return False
+        run_info()
+    elif command == "dsep":
+        if len(positional) != 2:
+            return False
+        run_dsep(positional[0], positional[1], options.get("given", []))
+    else:
+        if len(positional) != 2:
+            return False
+        run_paths(positional[0], positional[1])
+    return True
+
+
+# Options accepted by each fast-path command, mapped to their value count.
+# These mirror the Click declarations in backend.cli.main.
+_FAST_COMMANDS: dict[str, dict[str, int]] = {
+    "graph": {"edge": 2, "chain": 1, "node": 1, "json": 0},
+    "do": {"json": 0},
+    "info": {},
+    "dsep": {"given": 1},
+    "paths": {},
+}
+
+_FAST_ALIASES = {
+    "-e": "edge",
+    "--edge": "edge",
+    "-c": "chain",
+    "--chain": "chain",
+    "-n": "node",
+    "--node": "node",
+    "--json": "json",
+    "-g": "given",
+    "--given": "given",
+}
@@ -2,41 +2,33 @@
 
 from __future__ import annotations
 
-import json
+import functools
+import shlex
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.tree import Tree
-
-from backend import CausalGraph, IntervenedGraph
-from backend.tutorial import TutorialEngine
-from backend.tutorial.content import get_all_lessons
-from backend.tutorial import renderer as tutorial_renderer
-
-console = Console()
-err_console = Console(stderr=True)
-
-
-def read_graph_from_stdin() -> Optional[dict]:
-    """Read graph JSON from stdin if available."""
-    if not sys.stdin.isatty():
-        try:
-            return json.load(sys.stdin)
-        except json.JSONDecodeError:
-            return None
-    return None
 
+from backend import CausalGraph
+from backend.cli.commands import (
+    _print_graph_visual,
+    console,
+    err_console,
+    run_do,
+    run_dsep,
+    run_graph,
+    run_info,
+    run_paths,
+)
 
-def write_graph_to_stdout(graph: CausalGraph) -> None:
-    """Write graph as JSON to stdout."""
-    click.echo(json.dumps(graph.to_dict()))
+if TYPE_CHECKING:
+    from rich.table import Table
 
 
 def show_welcome() -> None:
     """Show welcome message with usage info."""
+    from rich.table import Table
+
     from backend import __version__
 
     console.print(f"\n[bold cyan]archy[/bold cyan] v{__version__}", highlight=False)
@@ -120,55 +112,7 @@ def graph(
         archy graph -c "A B C" -e D B       # Chain + edge
         archy graph -e X Y --json | archy info
     """
-    # Check for common mistake: unquoted chain arguments
-    if extra_args and chains:
-        err_console.print(
-            f"[red]Error:[/red] Unexpected arguments: {' '.join(extra_args)}\n"
-        )
-        err_console.print(
-            "[yellow]Hint:[/yellow] The -c/--chain option requires quotes around the node list:"
-        )
-        err_console.print(
-            f'  [green]archy graph -c "{chains[0]} {" ".join(extra_args)}"[/green]\n'
-        )
-        sys.exit(1)
-    elif extra_args:
-        err_console.print(
-            f"[red]Error:[/red] Unexpected arguments: {' '.join(extra_args)}\n"
-        )
-        err_console.print("Use -e for edges or -c for chains. See 'archy graph --help'")
-        sys.exit(1)
-
-    edge_list = [(e[0], e[1]) for e in edges]
-
-    # Parse chains into edges
-    for chain in chains:
-        chain_nodes = chain.split()
-        if len(chain_nodes) < 2:
-            err_console.print(
-                f"[red]Error:[/red] Chain '{chain}' needs at least 2 nodes.\n"
-            )
-            err_console.print(
-                "[yellow]Hint:[/yellow] Use quotes around multiple nodes:"
-            )
-            err_console.print('  [green]archy graph -c "A B C"[/green]')
-            sys.exit(1)
-        for i in range(len(chain_nodes) - 1):
-            edge_list.append((chain_nodes[i], chain_nodes[i + 1]))
-
-    try:
-        g = CausalGraph(edges=edge_list if edge_list else None)
-        for node in nodes:
-            if node not in g.get_nodes():
-                g._graph.add_node(node)
-    except ValueError as e:
-        err_console.print(f"[red]Error:[/red] {e}")
-        sys.exit(1)
-
-    if as_json:
-        write_graph_to_stdout(g)
-    else:
-        _print_graph_visual(g)
+    run_graph(edges, chains, nodes, as_json, extra_args)
 
 
 @cli.command()
@@ -184,41 +128,7 @@ def do(variables: tuple, as_json: bool) -> None:
         archy graph -e X Y -e Z Y --json | archy do Y
         archy graph -e X Y --json | archy do X Y
     """
-    data = read_graph_from_stdin()
-    if not data:
-        err_console.print(
-            "[red]Error:[/red] No graph provided. Pipe a graph to this command."
-        )
-        sys.exit(1)
-
-    if not variables:
-        err_console.print(
-            "[red]Error:[/red] Specify at least one variable to intervene on."
-        )
-        sys.exit(1)
-
-    try:
-        g = CausalGraph.from_dict(data)
-        intervened = IntervenedGraph(g, set(variables))
-
-        # Create new CausalGraph from intervened edges
-        result = CausalGraph(
-            edges=intervened.get_edges() if intervened.get_edges() else None
-        )
-        for node in intervened.get_nodes():
-            if node not in result.get_nodes():
-                result._graph.add_node(node)
-
-    except ValueError as e:
-        err_console.print(f"[red]Error:[/red] {e}")
-        sys.exit(1)
-
-    if as_json:
-        write_graph_to_stdout(result)
-    else:
-        var_str = ", ".join(variables)
-        console.print(f"[bold]After do({var_str}):[/bold]")
-        _print_graph_visual(result)
+    run_do(variables, as_json)
 
 
 @cli.command()
@@ -229,20 +139,7 @@ def info() -> None:
     Examples:
         archy graph -e X Y -e Z Y | archy info
     """
-    data = read_graph_from_stdin()
-    if not data:
-        err_console.print(
-            "[red]Error:[/red] No graph provided. Pipe a graph to this command."
-        )
-        sys.exit(1)
-
-    try:
-        g = CausalGraph.from_dict(data)
-    except ValueError as e:
-        err_console.print(f"[red]Error:[/red] {e}")
-        sys.exit(1)
-
-    _print_graph_info(g)
+    run_info()
 
 
 @cli.command()
@@ -256,25 +153,7 @@ def dsep(x: str, y: str, given: tuple) -> None:
     Examples:
         archy graph -e X Y -e Z Y | archy dsep X Z -g Y
     """
-    data = read_graph_from_stdin()
-    if not data:
-        err_console.print(
-            "[red]Error:[/red] No graph provided. Pipe a graph to this command."
-        )
-        sys.exit(1)
-
-    try:
-        g = CausalGraph.from_dict(data)
-        result = g.is_d_separated({x}, {y}, set(given))
-    except Exception as e:
-        err_console.print(f"[red]Error:[/red] {e}")
-        sys.exit(1)
-
-    given_str = f" | {', '.join(given)}" if given else ""
-    symbol = "⫫" if result else "⫫̸"
-    status = "[green]Yes[/green]" if result else "[red]No[/red]"
-
-    console.print(f"{x} {symbol} {y}{given_str}: {status}")
+    run_dsep(x, y, given)
 
 
 @cli.command()
@@ -287,26 +166,7 @@ def paths(treatment: str, outcome: str) -> None:
     Examples:
         archy graph -e X Y -e Z X -e Z Y | archy paths X Y
     """
-    data = read_graph_from_stdin()
-    if not data:
-        err_console.print(
-            "[red]Error:[/red] No graph provided. Pipe a graph to this command."
-        )
-        sys.exit(1)
-
-    try:
-        g = CausalGraph.from_dict(data)
-        backdoor = g.get_backdoor_paths(treatment, outcome)
-    except Exception as e:
-        err_console.print(f"[red]Error:[/red] {e}")
-        sys.exit(1)
-
-    console.print(f"[bold]Backdoor paths from {treatment} to {outcome}:[/bold]")
-    if backdoor:
-        for path in backdoor:
-            console.print(f"  [yellow]{'[/yellow] → [yellow]'.join(path)}[/yellow]")
-    else:
-        console.print("  [green]None (no confounding)[/green]")
+    run_paths(treatment, outcome)
 
 
 # Example causal structures
@@ -356,6 +216,54 @@ CAUSAL_EXAMPLES = {
 }
 
 
+def _parse_command_to_edges(command: str) -> list[tuple[str, str]]:
+    """Extract the edges from an `archy graph` example command."""
+    # Remove 'archy graph' prefix
+    args = shlex.split(command)[2:]
+
+    # Parse the arguments manually
+    edges = []
+    chains = []
+    i = 0
+    while i < len(args):
+        if args[i] in ("-e", "--edge"):
+            edges.append((args[i + 1], args[i + 2]))
+            i += 3
+        elif args[i] in ("-c", "--chain"):
+            chains.append(args[i + 1])
+            i += 2
+        else:
+            i += 1
+
+    edge_list = list(edges)
+    for chain in chains:
+        chain_nodes = chain.split()
+        for j in range(len(chain_nodes) - 1):
+            edge_list.append((chain_nodes[j], chain_nodes[j + 1]))
+    return edge_list
+
+
+# Edges of each example, parsed once rather than on every `examples --run`
+EXAMPLE_EDGES = {
+    key: _parse_command_to_edges(ex["command"]) for key, ex in CAUSAL_EXAMPLES.items()
+}
+
+
+@functools.cache
+def _examples_table() -> Table:
+    """Build the overview table of CAUSAL_EXAMPLES (built once, then reused)."""
+    from rich.table import Table
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Structure", style="cyan")
+    table.add_column("Description")
+    table.add_column("Pattern")
+
+    for key, ex in CAUSAL_EXAMPLES.items():
+        table.add_row(key, ex["name"], ex["diagram"].split("\n")[0])
+    return table
+
+
 @cli.command()
 @click.argument("structure", required=False)
 @click.option("--run", is_flag=True, help="Run the example command and show the graph")
@@ -379,21 +287,13 @@ def examples(structure: Optional[str], run: bool) -> None:
     """
     if structure is None:
         # List all examples
-        console.print("\n[bold cyan]Causal Structure Examples[/bold cyan]\n")
-
-        table = Table(show_header=True, header_style="bold")
-        table.add_column("Structure", style="cyan")
-        table.add_column("Description")
-        table.add_column("Pattern")
-
-        for key, ex in CAUSAL_EXAMPLES.items():
-            table.add_row(key, ex["name"], ex["diagram"].split("\n")[0])
-
-        console.print(table)
-        console.print("\n[dim]Run 'archy examples <structure>' for details[/dim]")
-        console.print(
-            "[dim]Run 'archy examples <structure> --run' to see the graph[/dim]\n"
-        )
+        with console:
+            console.print("\n[bold cyan]Causal Structure Examples[/bold cyan]\n")
+            console.print(_examples_table())
+            console.print("\n[dim]Run 'archy examples <structure>' for details[/dim]")
+            console.print(
+                "[dim]Run 'archy examples <structure> --run' to see the graph[/dim]\n"
+            )
         return
 
     if structure not in CAUSAL_EXAMPLES:
@@ -419,100 +319,13 @@ def examples(structure: Optional[str], run: bool) -> None:
 
     if run:
         console.print("[bold]Graph:[/bold]")
-        # Parse and execute the command
-        import shlex
-
-        args = shlex.split(ex["command"])
-        # Remove 'archy graph' prefix
-        args = args[2:]
-
-        # Parse the arguments manually
-        edges = []
-        chains = []
-        i = 0
-        while i < len(args):
-            if args[i] in ("-e", "--edge"):
-                edges.append((args[i + 1], args[i + 2]))
-                i += 3
-            elif args[i] in ("-c", "--chain"):
-                chains.append(args[i + 1])
-                i += 2
-            else:
-                i += 1
-
-        edge_list = list(edges)
-        for chain in chains:
-            chain_nodes = chain.split()
-            for j in range(len(chain_nodes) - 1):
-                edge_list.append((chain_nodes[j], chain_nodes[j + 1]))
-
         try:
-            g = CausalGraph(edges=edge_list)
+            g = CausalGraph(edges=EXAMPLE_EDGES[structure])
             _print_graph_visual(g)
         except ValueError as e:
             err_console.print(f"[red]Error:[/red] {e}")
 
 
-def _print_graph_visual(g: CausalGraph) -> None:
-    """Print a visual representation of the graph."""
-    nodes = g.get_nodes()
-    edges = g.get_edges()
-
-    if not nodes:
-        console.print("[dim]Empty graph[/dim]")
-        return
-
-    # Build tree from roots
-    roots = [n for n in nodes if not g.get_parents(n)]
-    if not roots:
-        roots = nodes[:1]  # Fallback if cyclic (shouldn't happen)
-
-    tree = Tree("[bold]Causal Graph[/bold]")
-
-    # Show edges
-    edge_str = ", ".join(f"{p}→{c}" for p, c in edges) if edges else "none"
-    tree.add(f"[dim]Edges:[/dim] {edge_str}")
-
-    # Show nodes with their relationships
-    for node in sorted(nodes):
-        parents = g.get_parents(node)
-        children = g.get_children(node)
-        parent_str = f" ← {{{', '.join(sorted(parents))}}}" if parents else ""
-        child_str = f" → {{{', '.join(sorted(children))}}}" if children else ""
-        tree.add(f"[cyan]{node}[/cyan]{parent_str}{child_str}")
-
-    console.print(tree)
-
-
-def _print_graph_info(g: CausalGraph) -> None:
-    """Print detailed graph information."""
-    nodes = g.get_nodes()
-    edges = g.get_edges()
-
-    table = Table(title="Graph Information")
-    table.add_column("Property", style="bold")
-    table.add_column("Value")
-
-    table.add_row("Nodes", str(len(nodes)))
-    table.add_row("Edges", str(len(edges)))
-    table.add_row("Node list", ", ".join(sorted(nodes)) if nodes else "-")
-
-    # Find roots and leaves
-    roots = [n for n in nodes if not g.get_parents(n)]
-    leaves = [n for n in nodes if not g.get_children(n)]
-
-    table.add_row("Roots (no parents)", ", ".join(sorted(roots)) if roots else "-")
-    table.add_row("Leaves (no children)", ", ".join(sorted(leaves)) if leaves else "-")
-
-    console.print(table)
-
-    # Edge list
-    if edges:
-        console.print("\n[bold]Edges:[/bold]")
-        for parent, child in edges:
-            console.print(f"  {parent} → {child}")
-
-
 @cli.command()
 @click.argument("lesson", required=False)
 @click.option("--list", "show_list", is_flag=True, help="List available lessons")
@@ -533,10 +346,13 @@ def learn(lesson: Optional[str], show_list: bool, help_commands: bool) -> None:
         archy learn graph-basics # Start specific lesson
         archy learn confounder   # Learn about confounders
     """
-    # Initialize engine with all lessons
-    engine = TutorialEngine()
-    for lesson_obj in get_all_lessons():
-        engine.register_lesson(lesson_obj)
+    from backend.tutorial import TutorialEngine
+    from backend.tutorial import renderer as tutorial_renderer
+    from backend.tutorial.content import (
+        get_all_lessons,
+        get_lesson_by_id,
+        get_lesson_ids,
+    )
 
     # Show commands help
     if help_commands:
@@ -546,15 +362,17 @@ def learn(lesson: Optional[str], show_list: bool, help_commands: bool) -> None:
     # List lessons
     if show_list or lesson is None:
         tutorial_renderer.render_welcome()
-        tutorial_renderer.render_lesson_list(engine.list_lessons())
+        tutorial_renderer.render_lesson_list(get_all_lessons())
         return
 
-    # Start specific lesson
+    # Start specific lesson; only that lesson is built
+    engine = TutorialEngine()
+    lesson_obj = get_lesson_by_id(lesson)
+    if lesson_obj:
+        engine.register_lesson(lesson_obj)
     if not engine.start_lesson(lesson):
         err_console.print(f"[red]Error:[/red] Unknown lesson '{lesson}'")
-        err_console.print(
-            f"Available: {', '.join(ls.id for ls in engine.list_lessons())}"
-        )
+        err_console.print(f"Available: {', '.join(get_lesson_ids())}")
         sys.exit(1)
 
     current_lesson = engine.current_lesson
@@ -7,15 +7,36 @@ with explicit functional relationships.
 
 from __future__ import annotations
 
-from typing import Callable, Optional
+from collections import ChainMap
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
 
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, PrivateAttr
 
 from backend.graph import CausalGraph
 
 # Type alias for structural equation functions: f(parent_values, error) -> value
 StructuralFunction = Callable[[list[float], float], float]
 
+# Vectorized form: f(parent_values[K, N], errors[N]) -> values[N]
+BatchStructuralFunction = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+# Array form used by compiled equations: f(parent_values[K], error) -> value
+CompiledStructuralFunction = Callable[[np.ndarray, float], float]
+
+# Numba signature for CompiledStructuralFunction; any array layout, since
+# batch evaluation passes strided columns
+_COMPILED_SIGNATURE = "float64(float64[:], float64)"
+
+# Whole-model evaluator generated by StructuralCausalModel.compile()
+CompiledEvaluator = Callable[
+    [Mapping[str, float], Mapping[str, float]], dict[str, float]
+]
+
+# Batch inputs accept a scalar (shared by every sample) or one value per sample
+BatchValue = float | np.ndarray
+
 
 class StructuralEquation(BaseModel):
     """Represents a structural equation in a causal model.
@@ -25,11 +46,38 @@ class StructuralEquation(BaseModel):
     """
 
     variable: str
-    function: Optional[StructuralFunction] = None
+    function: StructuralFunction | None = None
+    batch_function: BatchStructuralFunction | None = None
     parents: list[str] = []
-    error_distribution: Optional[str] = None  # e.g., "normal", "uniform"
+    error_distribution: str | None = None  # e.g., "normal", "uniform"
 
-    def evaluate(self, parent_values: dict[str, float], error: float = 0.0) -> float:
+    _compiled: CompiledStructuralFunction | None = PrivateAttr(default=None)
+
+    def compile(self) -> None:
+        """Prepare ``function`` for tight numeric evaluation loops.
+
+        When Numba is installed and ``function`` only uses Numba-supported
+        operations, it is JIT-compiled to take the parent values as a float64
+        array. Otherwise evaluation keeps using the plain Python function.
+        """
+        self._compiled = None
+        if not self.function:
+            return
+
+        try:
+            from numba import njit  # type: ignore[import]
+            from numba.core.errors import NumbaError  # type: ignore[import]
+        except ImportError:
+            return
+
+        try:
+            # An explicit signature compiles eagerly, so functions Numba cannot
+            # type fall back here rather than failing on first evaluation.
+            self._compiled = njit(_COMPILED_SIGNATURE)(self.function)
+        except (NumbaError, TypeError, ValueError):
+            return
+
+    def evaluate(self, parent_values: Mapping[str, float], error: float = 0.0) -> float:
         """Evaluate the structural equation.
 
         Args:
@@ -39,11 +87,59 @@ class StructuralEquation(BaseModel):
         Returns:
             Computed value for this variable
         """
+        if self._compiled is not None:
+            parent_arr = np.fromiter(
+                (parent_values.get(p, 0.0) for p in self.parents),
+                dtype=np.float64,
+                count=len(self.parents),
+            )
+            return float(self._compiled(parent_arr, error))
         if self.function:
             parent_list = [parent_values.get(p, 0.0) for p in self.parents]
             return self.function(parent_list, error)
         return error  # Default: just return error if no function
 
+    def evaluate_batch(
+        self, parent_values: Mapping[str, np.ndarray], errors: np.ndarray
+    ) -> np.ndarray:
+        """Evaluate the structural equation for many samples at once.
+
+        Uses ``batch_function`` when provided, otherwise falls back to calling
+        the scalar (or compiled) ``function`` once per sample.
+
+        Args:
+            parent_values: Dictionary of parent variable arrays, each of shape (N,)
+            errors: Error term array of shape (N,)
+
+        Returns:
+            Computed values for this variable, shape (N,)
+        """
+        n_samples = errors.shape[0]
+        if self.parents:
+            stacked = np.stack(
+                [parent_values.get(p, np.zeros(n_samples)) for p in self.parents]
+            )
+        else:
+            stacked = np.empty((0, n_samples))
+
+        if self.batch_function:
+            return np.asarray(self.batch_function(stacked, errors), dtype=np.float64)
+        if self._compiled is not None:
+            compiled = self._compiled
+            return np.fromiter(
+                (compiled(col, err) for col, err in zip(stacked.T, errors)),
+                dtype=np.float64,
+                count=n_samples,
+            )
+        if self.function:
+            function = self.function
+            return np.fromiter(
+                (function(list(col), err) for col, err in zip(stacked.T, errors)),
+                dtype=np.float64,
+                count=n_samples,
+            )
+        return errors.astype(np.float64, copy=True)
+
 
 class StructuralCausalModel:
     """A structural causal model (SCM) for counterfactual reasoning.
@@ -56,6 +152,10 @@ class StructuralCausalModel:
 
     graph: CausalGraph
     equations: dict[str, StructuralEquation]
+    _compiled_eval: CompiledEvaluator | None
+    _compiled_version: int
+    _plan_cache: dict[tuple[frozenset[str], frozenset[str], str], tuple[str, ...]]
+    _plan_version: int
 
     def __init__(self, graph: CausalGraph) -> None:
         """Initialize an SCM.
@@ -65,6 +165,10 @@ class StructuralCausalModel:
         """
         self.graph = graph
         self.equations = {}
+        self._compiled_eval = None
+        self._compiled_version = -1
+        self._plan_cache = {}
+        self._plan_version = graph._version
 
     def add_equation(self, equation: StructuralEquation) -> None:
         """Add a structural equation.
@@ -77,9 +181,50 @@ class StructuralCausalModel:
         if set(equation.parents) != graph_parents:
             raise ValueError(
                 f"Equation parents {set(equation.parents)} don't match "
-                f"graph parents {graph_parents} for variable {equation.variable}"
+                f"graph parents {set(graph_parents)} for variable {equation.variable}"
             )
         self.equations[equation.variable] = equation
+        self._compiled_eval = None
+        self._plan_cache.clear()
+
+    def compile(self) -> None:
+        """Generate a straight-line evaluator for the whole model.
+
+        Emits one Python function that evaluates every variable in topological
+        order, with each equation bound directly instead of looked up per call.
+        ``predict`` compiles on first use; call this to do it ahead of time.
+        """
+        self._compiled_eval = None
+        self._evaluator()
+
+    def predict(
+        self,
+        values: Mapping[str, float],
+        errors: Mapping[str, float] | None = None,
+    ) -> dict[str, float]:
+        """Evaluate every variable in the model.
+
+        Variables present in ``values`` are held fixed (observed or intervened
+        on); all others are computed from their structural equations, or taken
+        from their error term if they have none.
+
+        Args:
+            values: Fixed variable values
+            errors: Error terms (missing entries default to 0.0)
+
+        Returns:
+            Dictionary with a value for every variable in the graph
+        """
+        return self._evaluator()(values, errors or {})
+
+    def _evaluator(self) -> CompiledEvaluator:
+        """Get the compiled evaluator, regenerating it if the model changed."""
+        if self._compiled_eval is None or self._compiled_version != self.graph._version:
+            self._compiled_eval = _generate_evaluator(
+                self.graph.get_topological_order(), self.equations
+            )
+            self._compiled_version = self.graph._version
+        return self._compiled_eval
 
     def compute_counterfactual(
         self,
@@ -105,21 +250,98 @@ class StructuralCausalModel:
             Counterfactual value of query_variable
         """
         # Step 1: Abduction - infer error terms from factual evidence
-        # This is simplified - real abduction requires solving the system
         errors = self._abduce_errors(factual_evidence)
 
+        # Step 2: Action - apply intervention (intervened values shadow evidence).
+        # The empty front map takes the recomputed values, so neither input
+        # dict is modified.
+        values: ChainMap[str, float] = ChainMap({}, intervention, factual_evidence)
+
+        # Step 3: Prediction - recompute the affected variables, then the query
+        plan = self._plan(intervention, factual_evidence, query_variable)
+        for var in plan:
+            values[var] = self._compute_variable(var, values, errors)
+        return values[query_variable]
+
+    def compute_counterfactual_batch(
+        self,
+        intervention: Mapping[str, BatchValue],
+        factual_evidence: Mapping[str, BatchValue],
+        query_variable: str,
+        n_samples: int = 1,
+    ) -> np.ndarray:
+        """Compute a counterfactual value for a batch of samples.
+
+        Vectorized counterpart of ``compute_counterfactual``: every value is a
+        NumPy array of length ``n_samples`` and each variable in the plan is
+        evaluated once for the whole batch.
+
+        Args:
+            intervention: Dictionary of {variable: value(s)} to intervene on
+            factual_evidence: Observed values in the factual world
+            query_variable: Variable to query in the counterfactual world
+            n_samples: Number of samples (units) in the batch
+
+        Returns:
+            Counterfactual values of query_variable, shape (n_samples,)
+        """
+        evidence = {
+            var: _broadcast(val, n_samples) for var, val in factual_evidence.items()
+        }
+
+        # Step 1: Abduction - infer error terms from factual evidence
+        errors = self._abduce_errors_batch(evidence, n_samples)
+
         # Step 2: Action - apply intervention
-        intervened_values = factual_evidence.copy()
-        intervened_values.update(intervention)
+        values = dict(evidence)
+        values.update(
+            (var, _broadcast(val, n_samples)) for var, val in intervention.items()
+        )
+
+        # Step 3: Prediction - recompute the affected variables, then the query
+        plan = self._plan(intervention, factual_evidence, query_variable)
+        for var in plan:
+            values[var] = self._compute_variable_batch(var, values, errors)
+        return values[query_variable]
+
+    def _plan(
+        self,
+        intervention: Mapping[str, object],
+        evidence: Mapping[str, object],
+        query_variable: str,
+    ) -> tuple[str, ...]:
+        """Get the variables to recompute for a query, in topological order.
 
-        # Step 3: Prediction - compute counterfactual
-        return self._compute_variable(query_variable, intervened_values, errors)
+        The plan covers the query and those of its ancestors that the
+        intervention reaches or that were not observed; everything else keeps
+        its factual value. It only depends on which variables are intervened on
+        and observed, so it is cached by that shape and reused for any values.
+        """
+        if self._plan_version != self.graph._version:
+            self._plan_cache.clear()
+            self._plan_version = self.graph._version
+
+        key = (frozenset(intervention), frozenset(evidence), query_variable)
+        if key not in self._plan_cache:
+            relevant = self.graph.get_ancestors(query_variable) | {query_variable}
+            affected: set[str] = set()
+            for var in intervention:
+                if var in relevant:
+                    affected |= self.graph.get_descendants(var)
+            self._plan_cache[key] = tuple(
+                var
+                for var in self.graph.get_topological_order()
+                if var in relevant
+                and var not in intervention
+                and (var == query_variable or var in affected or var not in evidence)
+            )
+        return self._plan_cache[key]
 
-    def _abduce_errors(self, evidence: dict[str, float]) -> dict[str, float]:
+    def _abduce_errors(self, evidence: Mapping[str, float]) -> dict[str, float]:
         """Infer error terms from observed evidence.
 
-        This is a simplified version. In practice, this requires
-        solving the system of equations backwards.
+        Assumes additive errors (Y = f(PA_Y) + U_Y), so each observed variable
+        with an equation gets U_Y = Y - f(PA_Y); all other errors are zero.
 
         Args:
             evidence: Observed variable values
@@ -128,17 +350,51 @@ class StructuralCausalModel:
             Dictionary of inferred error terms
         """
         errors: dict[str, float] = {}
-        # Simplified: assume errors are zero for now
-        # Real implementation would solve: U = Y - f(PA_Y)
-        for var in self.graph.get_nodes():
-            errors[var] = 0.0
+        for var in self.graph.get_topological_order():
+            equation = self.equations.get(var)
+            if equation is None or var not in evidence:
+                errors[var] = 0.0
+            else:
+                errors[var] = evidence[var] - equation.evaluate(evidence, 0.0)
         return errors
 
+    def _abduce_errors_batch(
+        self, evidence: Mapping[str, np.ndarray], n_samples: int
+    ) -> dict[str, np.ndarray]:
+        """Infer error terms for a batch of samples.
+
+        Vectorized counterpart of ``_abduce_errors``: one residual pass over
+        the nodes, each producing an array of length n_samples.
+        """
+        zeros = np.zeros(n_samples)
+        errors: dict[str, np.ndarray] = {}
+        for var in self.graph.get_topological_order():
+            equation = self.equations.get(var)
+            if equation is None or var not in evidence:
+                errors[var] = zeros
+            else:
+                errors[var] = evidence[var] - equation.evaluate_batch(evidence, zeros)
+        return errors
+
+    def _compute_variable_batch(
+        self,
+        variable: str,
+        values: Mapping[str, np.ndarray],
+        errors: Mapping[str, np.ndarray],
+    ) -> np.ndarray:
+        """Vectorized counterpart of ``_compute_variable``."""
+        error = errors[variable]
+
+        if variable not in self.equations:
+            return values.get(variable, error)
+
+        return self.equations[variable].evaluate_batch(values, error)
+
     def _compute_variable(
         self,
         variable: str,
-        values: dict[str, float],
-        errors: dict[str, float],
+        values: Mapping[str, float],
+        errors: Mapping[str, float],
     ) -> float:
         """Compute a variable value given parent values and errors.
 
@@ -154,11 +410,51 @@ class StructuralCausalModel:
             # If no equation, return current value or error
             return values.get(variable, errors.get(variable, 0.0))
 
-        equation = self.equations[variable]
-        parent_values = {p: values.get(p, 0.0) for p in equation.parents}
+        # evaluate() only reads the equation's parents (defaulting to 0.0),
+        # so the full value map can be passed without building a sub-dict
         error = errors.get(variable, 0.0)
-
-        return equation.evaluate(parent_values, error)
+        return self.equations[variable].evaluate(values, error)
 
     def __repr__(self) -> str:
         return f"StructuralCausalModel(graph={self.graph}, equations={len(self.equations)})"
+
+
+def _broadcast(value: BatchValue, n_samples: int) -> np.ndarray:
+    """Expand a scalar or per-sample value to a float array of length n_samples."""
+    return np.broadcast_to(np.asarray(value, dtype=np.float64), (n_samples,)).copy()
+
+
+def _generate_evaluator(
+    order: Sequence[str], equations: Mapping[str, StructuralEquation]
+) -> CompiledEvaluator:
+    """Build a function that evaluates ``order`` as straight-line code.
+
+    For a graph X -> Y the generated source looks like::
+
+        def _evaluate(values, errors):
+            v0 = values['X'] if 'X' in values else errors.get('X', 0.0)
+            v1 = values['Y'] if 'Y' in values else f1([v0], errors.get('Y', 0.0))
+            return {'X': v0, 'Y': v1}
+    """
+    slots = {var: f"v{i}" for i, var in enumerate(order)}
+    namespace: dict[str, Any] = {}
+    lines = ["def _evaluate(values, errors):"]
+
+    for i, var in enumerate(order):
+        name = repr(var)
+        error = f"errors.get({name}, 0.0)"
+        equation = equations.get(var)
+        if equation is not None and equation.function is not None:
+            namespace[f"f{i}"] = equation.function
+            args = ", ".join(slots.get(p, "0.0") for p in equation.parents)
+            computed = f"f{i}([{args}], {error})"
+        else:
+            computed = error
+        lines.append(f"    v{i} = values[{name}] if {name} in values else {computed}")
+
+    fields = ", ".join(f"{var!r}: {slot}" for var, slot in slots.items())
+    lines.append(f"    return {{{fields}}}")
+
+    # Safe: the source only holds repr()'d node names and f{i}/v{i} identifiers
+    exec("\n".join(lines), namespace)  # noqa: S102
+    return namespace["_evaluate"]
@@ -6,9 +6,7 @@ allowing us to convert interventional distributions into observational ones.
 
 from __future__ import annotations
 
-from typing import Optional, Set
-
-import networkx as nx
+from collections.abc import Set as AbstractSet
 
 from backend.graph import CausalGraph
 from backend.interventions import IntervenedGraph
@@ -18,6 +16,9 @@ class DoCalculus:
     """Implements do-calculus rules for causal reasoning."""
 
     graph: CausalGraph
+    _intervened: dict[frozenset[str], IntervenedGraph]
+    _dsep_results: dict[tuple[frozenset[str], ...], bool]
+    _graph_version: int
 
     def __init__(self, graph: CausalGraph) -> None:
         """Initialize with a causal graph.
@@ -26,8 +27,17 @@ class DoCalculus:
             graph: The causal graph to reason about
         """
         self.graph = graph
-
-    def rule1(self, y: Set[str], z: Set[str], w: Set[str], x: Set[str]) -> bool:
+        self._intervened = {}
+        self._dsep_results = {}
+        self._graph_version = graph._version
+
+    def rule1(
+        self,
+        y: AbstractSet[str],
+        z: AbstractSet[str],
+        w: AbstractSet[str],
+        x: AbstractSet[str],
+    ) -> bool:
         """Do-calculus Rule 1: Insertion/deletion of observations.
 
         P(y | do(x), z, w) = P(y | do(x), w) if (Y ⟂ Z | X, W)_{G_{\bar{X}}}
@@ -44,13 +54,17 @@ class DoCalculus:
         Returns:
             True if the rule applies (Z can be removed)
         """
-        intervened_graph = IntervenedGraph(self.graph, x)
+        intervened_graph = self._intervene(x)
         # Check d-separation in the intervened graph
-        return intervened_graph._graph is not None and self._check_d_separation(
-            intervened_graph, y, z, w
-        )
+        return self._check_d_separation(intervened_graph, y, z, w)
 
-    def rule2(self, y: Set[str], z: Set[str], w: Set[str], x: Set[str]) -> bool:
+    def rule2(
+        self,
+        y: AbstractSet[str],
+        z: AbstractSet[str],
+        w: AbstractSet[str],
+        x: AbstractSet[str],
+    ) -> bool:
         """Do-calculus Rule 2: Action/observation exchange.
 
         P(y | do(x), do(z), w) = P(y | do(x), z, w) if (Y ⟂ Z | X, W)_{G_{X̄_Z̲}}
@@ -69,11 +83,17 @@ class DoCalculus:
         """
         # Graph with X intervened but Z not intervened
         # This means we remove edges into X but keep edges into Z
-        intervened_graph = IntervenedGraph(self.graph, x)
+        intervened_graph = self._intervene(x)
         # Check d-separation
         return self._check_d_separation(intervened_graph, y, z, w)
 
-    def rule3(self, y: Set[str], z: Set[str], w: Set[str], x: Set[str]) -> bool:
+    def rule3(
+        self,
+        y: AbstractSet[str],
+        z: AbstractSet[str],
+        w: AbstractSet[str],
+        x: AbstractSet[str],
+    ) -> bool:
         """Do-calculus Rule 3: Insertion/deletion of actions.
 
         P(y | do(x), do(z), w) = P(y | do(x), w) if (Y ⟂ Z | X, W)_{G_{\bar{X}\bar{Z}}}
@@ -91,21 +111,51 @@ class DoCalculus:
             True if the rule applies (Z intervention can be removed)
         """
         # Graph with both X and Z intervened
-        intervened_graph = IntervenedGraph(self.graph, x | z)
+        intervened_graph = self._intervene(x | z)
         # Check d-separation
         return self._check_d_separation(intervened_graph, y, z, w)
 
+    def _intervene(self, x: AbstractSet[str]) -> IntervenedGraph:
+        """Get the graph with incoming edges to x removed.
+
+        Mutilated graphs are shared across rule checks, so checking all three
+        rules for the same query builds each subgraph only once. They are live
+        views, so they stay valid when the graph is edited.
+        """
+        key = frozenset(x)
+        if key not in self._intervened:
+            self._intervened[key] = IntervenedGraph.get(self.graph, key)
+        return self._intervened[key]
+
+    def _sync_graph_version(self) -> None:
+        """Drop cached d-separation results if the graph has changed."""
+        if self._graph_version != self.graph._version:
+            self._dsep_results.clear()
+            self._graph_version = self.graph._version
+
     def _check_d_separation(
-        self, graph: IntervenedGraph, y: Set[str], z: Set[str], w: Set[str]
+        self,
+        graph: IntervenedGraph,
+        y: AbstractSet[str],
+        z: AbstractSet[str],
+        w: AbstractSet[str],
     ) -> bool:
         """Helper to check d-separation in an intervened graph."""
-        try:
-            return nx.is_d_separator(graph._graph, y, z, w)
-        except Exception:
-            return False
+        self._sync_graph_version()
+        key = (graph.interventions, frozenset(y), frozenset(z), frozenset(w))
+        if key not in self._dsep_results:
+            try:
+                result = graph.is_d_separated(y, z, w)
+            except Exception:
+                result = False
+            self._dsep_results[key] = result
+        return self._dsep_results[key]
 
     def is_identifiable(
-        self, y: Set[str], x: Set[str], z: Optional[Set[str]] = None
+        self,
+        y: AbstractSet[str],
+        x: AbstractSet[str],
+        z: AbstractSet[str] | None = None,
     ) -> bool:
         """Check if P(y | do(x)) is identifiable from observational data.
 
@@ -125,13 +175,13 @@ class DoCalculus:
         if z is None:
             z = set()
 
-        # Check if we can block all backdoor paths
-        for x_var in x:
-            for y_var in y:
-                backdoor_paths = self.graph.get_backdoor_paths(x_var, y_var)
-                if backdoor_paths:
-                    # Check if conditioning on Z blocks these paths
-                    # This is simplified - real identifiability is more nuanced
-                    pass
+        # Check if we can block all backdoor paths; only their existence
+        # matters here, so stop at the first pair that has one
+        if any(
+            self.graph.has_backdoor_path(x_var, y_var) for x_var in x for y_var in y
+        ):
+            # Check if conditioning on Z blocks these paths
+            # This is simplified - real identifiability is more nuanced
+            pass
 
         return True  # Simplified - would need full algorithm
@@ -2,9 +2,263 @@
 
 from __future__ import annotations
 
-from typing import Any, List, Optional, Set, Tuple
+import bisect
+import sys
+from collections.abc import Hashable, Iterable, Iterator
+from collections.abc import Set as AbstractSet
+from itertools import pairwise
+from typing import Any, NamedTuple
 
 import networkx as nx
+import numpy as np
+
+
+class _Adjacency(NamedTuple):
+    """Read-only snapshot of a graph's edges over integer node ids.
+
+    Node names map to ids once, through ``names`` and ``ids``; the searches
+    below then work purely on ints. Edges are kept both as CSR arrays, for
+    vectorized edits such as ``without_parents``, and as per-node tuples of
+    neighbour ids, which pure-Python traversals index fastest.
+    """
+
+    names: tuple[str, ...]
+    ids: dict[str, int]
+    succ_indptr: np.ndarray
+    succ_indices: np.ndarray
+    pred_indptr: np.ndarray
+    pred_indices: np.ndarray
+    succ_ids: tuple[tuple[int, ...], ...]
+    pred_ids: tuple[tuple[int, ...], ...]
+    # The same neighbours as int bitmasks (bit j set = node j), for the
+    # set-at-a-time search on small graphs
+    succ_bits: tuple[int, ...]
+    pred_bits: tuple[int, ...]
+    # Masks of each conditioning set plus its ancestors, filled in lazily
+    ancestor_masks: dict[frozenset[str], bytearray]
+
+    @classmethod
+    def build(cls, graph: nx.DiGraph) -> _Adjacency:
+        """Build successor and predecessor CSR arrays from a DiGraph."""
+        names = tuple(graph.nodes())
+        ids = {name: i for i, name in enumerate(names)}
+        n_edges = graph.number_of_edges()
+        src = np.fromiter((ids[u] for u, _ in graph.edges()), np.int32, n_edges)
+        dst = np.fromiter((ids[v] for _, v in graph.edges()), np.int32, n_edges)
+        return cls._from_edges(names, ids, src, dst)
+
+    @classmethod
+    def _from_edges(
+        cls,
+        names: tuple[str, ...],
+        ids: dict[str, int],
+        src: np.ndarray,
+        dst: np.ndarray,
+    ) -> _Adjacency:
+        succ_indptr, succ_indices = _csr(src, dst, len(names))
+        pred_indptr, pred_indices = _csr(dst, src, len(names))
+        succ_ids = _neighbour_ids(succ_indptr, succ_indices)
+        pred_ids = _neighbour_ids(pred_indptr, pred_indices)
+        return cls(
+            names,
+            ids,
+            succ_indptr,
+            succ_indices,
+            pred_indptr,
+            pred_indices,
+            succ_ids,
+            pred_ids,
+            tuple(_bitmask(js) for js in succ_ids),
+            tuple(_bitmask(js) for js in pred_ids),
+            {},
+        )
+
+    def without_parents(self, nodes: Iterable[str]) -> _Adjacency:
+        """Get a copy with all incoming edges of the given nodes removed."""
+        cut = np.zeros(len(self.names), dtype=bool)
+        cut[[self.ids[v] for v in nodes]] = True
+        src = np.repeat(
+            np.arange(len(self.names), dtype=np.int32), np.diff(self.succ_indptr)
+        )
+        keep = ~cut[self.succ_indices]
+        return self._from_edges(
+            self.names, self.ids, src[keep], self.succ_indices[keep]
+        )
+
+    def ancestor_mask(self, nodes: AbstractSet[str]) -> bytearray:
+        """Get a mask of the given nodes and all their ancestors.
+
+        Cached per node set, so d-separation queries that share a
+        conditioning set (e.g. the do-calculus rules for one query) only
+        walk up from it once.
+        """
+        key = frozenset(nodes)
+        mask = self.ancestor_masks.get(key)
+        if mask is None:
+            mask = self.reachable([self.ids[v] for v in key], upstream=True)
+            self.ancestor_masks[key] = mask
+        return mask
+
+    def reachable(self, starts: list[int], upstream: bool) -> bytearray:
+        """Get a mask of the start ids and every id reachable from them.
+
+        Args:
+            starts: Node ids to start from
+            upstream: Follow edges to parents if True, to children otherwise
+        """
+        neighbours = self.pred_ids if upstream else self.succ_ids
+        mask = bytearray(len(self.names))
+        for i in starts:
+            mask[i] = 1
+        frontier = list(starts)
+        while frontier:
+            for j in neighbours[frontier.pop()]:
+                if not mask[j]:
+                    mask[j] = 1
+                    frontier.append(j)
+        return mask
+
+    def node_id(self, node: str) -> int:
+        """Look up a node's id, raising like NetworkX for unknown nodes."""
+        try:
+            return self.ids[node]
+        except KeyError:
+            raise nx.NetworkXError(f"The node {node} is not in the digraph.") from None
+
+    def is_d_separated(
+        self, x: AbstractSet[str], y: AbstractSet[str], z: AbstractSet[str]
+    ) -> bool:
+        """Check d-separation with the Bayes-ball reachability algorithm.
+
+        Raises the same NetworkX errors as ``nx.is_d_separator`` for
+        overlapping sets or unknown nodes.
+        """
+        intersection = x & y or x & z or y & z
+        if intersection:
+            raise nx.NetworkXError(
+                f"The sets are not disjoint, with intersection {intersection}"
+            )
+        unknown = (x | y | z) - self.ids.keys()
+        if unknown:
+            raise nx.NodeNotFound(f"The node(s) {unknown} are not found in G")
+        if len(self.names) <= _BITSET_MAX_NODES:
+            return self._is_d_separated_bits(x, y, z)
+
+        n = len(self.names)
+        pred, succ = self.pred_ids, self.succ_ids
+        in_z = bytearray(n)
+        in_y = bytearray(n)
+        for v in z:
+            in_z[self.ids[v]] = 1
+        for v in y:
+            in_y[self.ids[v]] = 1
+
+        # Z and its ancestors: a collider is open iff it is in this set
+        z_anc = self.ancestor_mask(z)
+
+        # Bounce the ball from X, tracking visits separately for arriving
+        # from a child (moving up) and from a parent (moving down)
+        visited_up = bytearray(n)
+        visited_down = bytearray(n)
+        stack = [(self.ids[v], False) for v in x]
+        while stack:
+            i, down = stack.pop()
+            visited = visited_down if down else visited_up
+            if visited[i]:
+                continue
+            visited[i] = 1
+            if in_y[i]:
+                return False
+            if not down:
+                if not in_z[i]:
+                    stack.extend((j, False) for j in pred[i])
+                    stack.extend((j, True) for j in succ[i])
+            else:
+                if not in_z[i]:
+                    stack.extend((j, True) for j in succ[i])
+                if z_anc[i]:
+                    stack.extend((j, False) for j in pred[i])
+        return True
+
+    def _is_d_separated_bits(
+        self, x: AbstractSet[str], y: AbstractSet[str], z: AbstractSet[str]
+    ) -> bool:
+        """Bayes-ball over int bitmasks, expanding a whole frontier per step.
+
+        Same search as ``is_d_separated``, but each visited set is one int,
+        so marking and filtering a frontier are single bignum operations.
+        """
+        ids = self.ids
+        pred, succ = self.pred_bits, self.succ_bits
+        x_bits = _bitmask(ids[v] for v in x)
+        y_bits = _bitmask(ids[v] for v in y)
+        z_bits = _bitmask(ids[v] for v in z)
+
+        # Z and its ancestors, as a fixed point of OR-ing in parents
+        z_anc = frontier = z_bits
+        while frontier:
+            parents = 0
+            for i in _bit_indices(frontier):
+                parents |= pred[i]
+            frontier = parents & ~z_anc
+            z_anc |= frontier
+
+        visited_up = visited_down = 0
+        up, down = x_bits, 0
+        while up or down:
+            if (up | down) & y_bits:
+                return False
+            visited_up |= up
+            visited_down |= down
+            next_up = next_down = 0
+            for i in _bit_indices(up & ~z_bits):
+                next_up |= pred[i]
+                next_down |= succ[i]
+            for i in _bit_indices(down & ~z_bits):
+                next_down |= succ[i]
+            for i in _bit_indices(down & z_anc):
+                next_up |= pred[i]
+            up = next_up & ~visited_up
+            down = next_down & ~visited_down
+        return True
+
+
+# Above this many nodes the per-step bignum operations outweigh the savings
+# of the bitmask search, and d-separation falls back to the id-tuple search
+_BITSET_MAX_NODES = 1024
+
+
+def _bitmask(ids: Iterable[int]) -> int:
+    """Pack node ids into an int with those bits set."""
+    bits = 0
+    for i in ids:
+        bits |= 1 << i
+    return bits
+
+
+def _bit_indices(bits: int) -> Iterator[int]:
+    """Yield the positions of the set bits, lowest first."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def _neighbour_ids(
+    indptr: np.ndarray, indices: np.ndarray
+) -> tuple[tuple[int, ...], ...]:
+    """Split CSR indices into one tuple of neighbour ids per node."""
+    bounds = indptr.tolist()
+    flat = indices.tolist()
+    return tuple(tuple(flat[a:b]) for a, b in pairwise(bounds))
+
+
+def _csr(rows: np.ndarray, cols: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Group cols by rows into (indptr, indices) arrays."""
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    indices = cols[np.argsort(rows, kind="stable")]
+    return indptr, indices
 
 
 class CausalGraph:
@@ -12,11 +266,18 @@ class CausalGraph:
 
     This class provides the foundation for causal reasoning operations
     including do-calculus, interventions, and counterfactuals.
+
+    Node names are interned on the way in, so the many set and dict lookups
+    keyed by them compare by identity rather than character by character.
     """
 
     _graph: nx.DiGraph
+    _cache: dict[Hashable, Any]
+    _version: int
+    _topo: tuple[str, ...] | None
+    _sorted_edges: list[tuple[str, str]] | None
 
-    def __init__(self, edges: Optional[List[Tuple[str, str]]] = None) -> None:
+    def __init__(self, edges: list[tuple[str, str]] | None = None) -> None:
         """Initialize a causal graph.
 
         Args:
@@ -24,12 +285,15 @@ class CausalGraph:
                   If None, creates an empty graph.
         """
         self._graph = nx.DiGraph()
-        if edges:
-            self._graph.add_edges_from(edges)
-
-        # Validate it's a DAG
-        if not nx.is_directed_acyclic_graph(self._graph):
-            raise ValueError("Graph must be a directed acyclic graph (DAG)")
+        self._cache = {}
+        self._version = 0
+        self._topo = None
+        self._sorted_edges = None
+        for parent, child in edges or []:
+            parent, child = sys.intern(parent), sys.intern(child)
+            if self._creates_cycle(parent, child):
+                raise ValueError("Graph must be a directed acyclic graph (DAG)")
+            self._graph.add_edge(parent, child)
 
     def add_edge(self, parent: str, child: str) -> None:
         """Add a causal edge from parent to child.
@@ -41,40 +305,168 @@ class CausalGraph:
         Raises:
             ValueError: If adding the edge would create a cycle
         """
-        self._graph.add_edge(parent, child)
-        if not nx.is_directed_acyclic_graph(self._graph):
-            self._graph.remove_edge(parent, child)
+        parent, child = sys.intern(parent), sys.intern(child)
+        if self._creates_cycle(parent, child):
             raise ValueError(f"Adding edge ({parent}, {child}) would create a cycle")
+        self._topo = self._topological_order_with_edge(parent, child)
+        if self._sorted_edges is not None and not self._graph.has_edge(parent, child):
+            bisect.insort(self._sorted_edges, (parent, child))
+        self._graph.add_edge(parent, child)
+        self._invalidate()
+
+    def _topological_order_with_edge(
+        self, parent: str, child: str
+    ) -> tuple[str, ...] | None:
+        """Update the cached topological order for a new edge, if possible.
+
+        New nodes can always be placed at the ends (a new parent first, a new
+        child last); an edge between existing nodes keeps the order valid when
+        parent already precedes child. Otherwise the order is recomputed lazily.
+        """
+        order = self._topo
+        if order is None:
+            return None
+        if parent not in self._graph:
+            order = (parent, *order)
+        if child not in self._graph:
+            return (*order, child)
+        if parent in self._graph and order.index(parent) > order.index(child):
+            return None
+        return order
+
+    def _creates_cycle(self, parent: str, child: str) -> bool:
+        """Check whether adding parent -> child would close a directed cycle.
+
+        The graph is already acyclic, so a new edge only creates a cycle if
+        parent is reachable from child; this avoids a full DAG scan per edge.
+        """
+        if parent == child:
+            return True
+        if parent not in self._graph or child not in self._graph:
+            return False
+        return nx.has_path(self._graph, child, parent)
+
+    def add_node(self, node: str) -> None:
+        """Add an isolated node (no-op if it already exists)."""
+        node = sys.intern(node)
+        if node in self._graph:
+            return
+        if self._topo is not None:
+            self._topo = (*self._topo, node)
+        self._graph.add_node(node)
+        self._invalidate()
 
     def remove_edge(self, parent: str, child: str) -> None:
         """Remove a causal edge."""
+        # Removing an edge never invalidates a topological order, so _topo stays
         self._graph.remove_edge(parent, child)
+        if self._sorted_edges is not None:
+            del self._sorted_edges[
+                bisect.bisect_left(self._sorted_edges, (parent, child))
+            ]
+        self._invalidate()
 
-    def get_parents(self, node: str) -> Set[str]:
+    def _invalidate(self) -> None:
+        """Drop memoized query results after the structure changes.
+
+        The version counter lets objects derived from this graph (such as
+        DoCalculus) tell when their own caches are stale.
+        """
+        self._cache.clear()
+        self._version += 1
+
+    def _adjacency(self, intervened: AbstractSet[str] = frozenset()) -> _Adjacency:
+        """Get a CSR snapshot of the graph, rebuilt after structural changes.
+
+        The networkx DiGraph stays the source of truth for edits; read-heavy
+        queries scan these flat arrays instead of its dict-of-dicts.
+
+        Args:
+            intervened: Nodes whose incoming edges are left out of the snapshot,
+                as for an IntervenedGraph
+        """
+        key = ("adjacency", frozenset(intervened))
+        if key not in self._cache:
+            if intervened:
+                self._cache[key] = self._adjacency().without_parents(intervened)
+            else:
+                self._cache[key] = _Adjacency.build(self._graph)
+        return self._cache[key]
+
+    def get_parents(self, node: str) -> frozenset[str]:
         """Get all parent nodes of a given node."""
-        return set(self._graph.predecessors(node))
+        key = ("parents", node)
+        if key not in self._cache:
+            adj = self._adjacency()
+            ids = adj.pred_ids[adj.node_id(node)]
+            self._cache[key] = frozenset(adj.names[i] for i in ids)
+        return self._cache[key]
 
-    def get_children(self, node: str) -> Set[str]:
+    def get_children(self, node: str) -> frozenset[str]:
         """Get all child nodes of a given node."""
-        return set(self._graph.successors(node))
+        key = ("children", node)
+        if key not in self._cache:
+            adj = self._adjacency()
+            ids = adj.succ_ids[adj.node_id(node)]
+            self._cache[key] = frozenset(adj.names[i] for i in ids)
+        return self._cache[key]
 
-    def get_ancestors(self, node: str) -> Set[str]:
+    def get_ancestors(self, node: str) -> frozenset[str]:
         """Get all ancestor nodes (parents, grandparents, etc.) of a given node."""
-        return set(nx.ancestors(self._graph, node))
+        key = ("ancestors", node)
+        if key not in self._cache:
+            self._cache[key] = self._reachable_names(node, upstream=True)
+        return self._cache[key]
 
-    def get_descendants(self, node: str) -> Set[str]:
+    def get_descendants(self, node: str) -> frozenset[str]:
         """Get all descendant nodes (children, grandchildren, etc.) of a given node."""
-        return set(nx.descendants(self._graph, node))
+        key = ("descendants", node)
+        if key not in self._cache:
+            self._cache[key] = self._reachable_names(node, upstream=False)
+        return self._cache[key]
+
+    def _reachable_names(self, node: str, upstream: bool) -> frozenset[str]:
+        """Walk the integer-id adjacency from a node, then map ids to names."""
+        adj = self._adjacency()
+        i = adj.node_id(node)
+        mask = adj.reachable([i], upstream)
+        mask[i] = 0
+        hits = np.flatnonzero(np.frombuffer(mask, dtype=bool)).tolist()
+        return frozenset(adj.names[j] for j in hits)
 
-    def get_nodes(self) -> List[str]:
+    def get_nodes(self) -> list[str]:
         """Get all nodes in the graph."""
         return list(self._graph.nodes())
 
-    def get_edges(self) -> List[Tuple[str, str]]:
+    def get_edges(self) -> list[tuple[str, str]]:
         """Get all edges in the graph."""
         return list(self._graph.edges())
 
-    def is_d_separated(self, x: Set[str], y: Set[str], z: Set[str]) -> bool:
+    def get_sorted_edges(self) -> tuple[tuple[str, str], ...]:
+        """Get all edges in sorted order.
+
+        Sorted once and then kept sorted across edits, so repeated renders of
+        a graph that changes an edge at a time never re-sort. The returned
+        tuple is memoized until the next edit, so reads don't copy.
+        """
+        key = ("sorted_edges",)
+        if key not in self._cache:
+            if self._sorted_edges is None:
+                self._sorted_edges = sorted(self._graph.edges())
+            self._cache[key] = tuple(self._sorted_edges)
+        return self._cache[key]
+
+    def get_topological_order(self) -> tuple[str, ...]:
+        """Get all nodes ordered so that every parent precedes its children.
+
+        Computed once and then maintained across edits where possible, rather
+        than re-sorting after every change.
+        """
+        if self._topo is None:
+            self._topo = tuple(nx.topological_sort(self._graph))
+        return self._topo
+
+    def is_d_separated(self, x: set[str], y: set[str], z: set[str]) -> bool:
         """Check if sets X and Y are d-separated given Z.
 
         This is fundamental for causal reasoning - d-separation determines
@@ -88,14 +480,18 @@ class CausalGraph:
         Returns:
             True if X and Y are d-separated given Z
         """
-        # Use networkx's d-separation check
-        return nx.is_d_separator(self._graph, x, y, z)
+        key = ("dsep", frozenset(x), frozenset(y), frozenset(z))
+        if key not in self._cache:
+            self._cache[key] = self._adjacency().is_d_separated(x, y, z)
+        return self._cache[key]
 
-    def get_backdoor_paths(self, treatment: str, outcome: str) -> List[List[str]]:
+    def get_backdoor_paths(self, treatment: str, outcome: str) -> list[list[str]]:
         """Find all backdoor paths from treatment to outcome.
 
         Backdoor paths are paths that start with an arrow pointing into treatment.
-        These need to be blocked for proper causal effect estimation.
+        These need to be blocked for proper causal effect estimation. Paths that
+        pass through a collider are already blocked, so only open paths are
+        returned.
 
         Args:
             treatment: Treatment variable
@@ -104,28 +500,122 @@ class CausalGraph:
         Returns:
             List of paths, where each path is a list of node names
         """
-        paths = []
-        # Find all simple paths from treatment to outcome
-        for path in nx.all_simple_paths(self._graph, treatment, outcome):
-            # Check if it's a backdoor path (starts with incoming edge)
-            # In a DAG, we need to check if there's a path that goes backwards
-            # from treatment first
-            parents = self.get_parents(treatment)
-            if parents:
-                # Check paths through parents
-                for parent in parents:
-                    if parent in path:
-                        paths.append(path)
+        paths: list[list[str]] = []
+
+        # Once a path turns downstream it can only reach outcome through
+        # outcome's ancestors, so other children are pruned immediately.
+        reachable = self.get_ancestors(outcome) | {outcome}
+
+        # Depth-first search from each parent of treatment, extending a single
+        # path in place. An open path walks upstream (against edges) and may
+        # turn downstream once at a fork; turning back upstream would make the
+        # turning node a collider. Every path is built once, so no dedup pass.
+        path = [treatment]
+        on_path = {treatment}
+        frames = [iter([(p, True) for p in sorted(self.get_parents(treatment))])]
+        while frames:
+            step = next(frames[-1], None)
+            if step is None:
+                frames.pop()
+                on_path.discard(path.pop())
+                continue
+
+            node, upstream = step
+            if node in on_path or (not upstream and node not in reachable):
+                continue
+            if node == outcome:
+                paths.append([*path, node])
+                continue
+
+            path.append(node)
+            on_path.add(node)
+            moves = [(c, False) for c in self.get_children(node)]
+            if upstream:
+                moves.extend((p, True) for p in self.get_parents(node))
+            frames.append(iter(sorted(moves)))
+
         return paths
 
+    def has_backdoor_path(self, treatment: str, outcome: str) -> bool:
+        """Check whether any open backdoor path runs from treatment to outcome.
+
+        Equivalent to ``bool(get_backdoor_paths(treatment, outcome))`` without
+        enumerating paths: an open backdoor path climbs from treatment to some
+        ancestor and then descends to outcome without passing through
+        treatment, so it exists iff a treatment ancestor is outcome or one of
+        outcome's ancestors along edges that avoid treatment.
+
+        Args:
+            treatment: Treatment variable
+            outcome: Outcome variable
+
+        Returns:
+            True if at least one open backdoor path exists
+        """
+        key = ("has_backdoor", treatment, outcome)
+        if key not in self._cache:
+            upstream = self.get_ancestors(treatment)
+            found = treatment != outcome and outcome in upstream
+            seen = {outcome}
+            stack = [outcome] if treatment != outcome else []
+            while stack and not found:
+                for parent in self.get_parents(stack.pop()):
+                    if parent in upstream:
+                        found = True
+                        break
+                    if parent != treatment and parent not in seen:
+                        seen.add(parent)
+                        stack.append(parent)
+            self._cache[key] = found
+        return self._cache[key]
+
     def to_dict(self) -> dict[str, Any]:
-        """Serialize graph to dictionary format."""
-        return {"nodes": self.get_nodes(), "edges": self.get_edges()}
+        """Serialize graph to dictionary format.
+
+        Nodes are listed in topological order, which lets ``from_dict`` confirm
+        the graph is acyclic with a single pass over the edges.
+        """
+        return {"nodes": list(self.get_topological_order()), "edges": self.get_edges()}
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> CausalGraph:
-        """Create graph from dictionary format."""
-        return cls(edges=data.get("edges", []))
+        """Create graph from dictionary format.
+
+        The edges are added in bulk and the result is checked for cycles once,
+        instead of once per edge as ``__init__`` and ``add_edge`` do. When the
+        nodes are listed in topological order, as ``to_dict`` writes them, that
+        check is a single comparison per edge; otherwise a topological sort is
+        run.
+
+        Raises:
+            ValueError: If the edges do not form a DAG
+        """
+        graph = cls._from_validated(
+            (tuple(edge) for edge in data.get("edges", [])), data.get("nodes", [])
+        )
+        position = {node: i for i, node in enumerate(graph._graph)}
+        if all(position[p] < position[c] for p, c in graph._graph.edges()):
+            graph._topo = tuple(position)
+            return graph
+        try:
+            graph._topo = tuple(nx.topological_sort(graph._graph))
+        except nx.NetworkXUnfeasible:
+            raise ValueError("Graph must be a directed acyclic graph (DAG)") from None
+        return graph
+
+    @classmethod
+    def _from_validated(
+        cls, edges: Iterable[tuple[str, str]], nodes: Iterable[str] = ()
+    ) -> CausalGraph:
+        """Create a graph from edges already known to form a DAG.
+
+        Skips the per-edge cycle check, so only use this for edges taken from
+        an existing CausalGraph (e.g. after an intervention removed some).
+        """
+        graph = cls()
+        graph._graph.add_nodes_from(sys.intern(n) for n in nodes)
+        graph._graph.add_edges_from((sys.intern(p), sys.intern(c)) for p, c in edges)
+        return graph
 
     def __repr__(self) -> str:
         return (
@@ -2,24 +2,30 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Set, List, Tuple
+import weakref
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import networkx as nx
-from pydantic import BaseModel
 
 if TYPE_CHECKING:
     from backend.graph import CausalGraph
 
 
-class Intervention(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Intervention:
     """Represents a do-intervention on a causal graph.
 
     An intervention sets a variable to a specific value, breaking
     its causal dependencies (removing incoming edges).
+
+    A plain value object: a slotted dataclass is far cheaper to create than
+    a validated pydantic model.
     """
 
     variable: str
-    value: Optional[float] = None
+    value: float | None = None
 
     def __repr__(self) -> str:
         val_str = f"={self.value}" if self.value is not None else ""
@@ -31,52 +37,106 @@ class IntervenedGraph:
 
     When we intervene on a variable, we remove all incoming edges
     to that variable, effectively setting it to a fixed value.
+
+    This is a read-only view over the original graph: the accessors filter
+    out the removed edges on demand instead of materializing a new graph.
     """
 
+    # Do-calculus creates many short-lived views; slots keep them small and
+    # cheap to build (__weakref__ is needed for the shared view cache)
+    __slots__ = ("__weakref__", "interventions", "original_graph")
+
     original_graph: CausalGraph
-    interventions: Set[str]
-    _graph: nx.DiGraph
+    interventions: frozenset[str]
 
-    def __init__(self, graph: CausalGraph, interventions: Set[str]) -> None:
+    def __init__(self, graph: CausalGraph, interventions: AbstractSet[str]) -> None:
         """Create an intervened graph.
 
         Args:
             graph: The original CausalGraph
             interventions: Set of variable names to intervene on
         """
+        for var in interventions:
+            if var not in graph._graph:
+                raise nx.NetworkXError(f"The node {var} is not in the digraph.")
         self.original_graph = graph
-        self.interventions = interventions
-        self._build_intervened_graph()
-
-    def _build_intervened_graph(self) -> None:
-        """Build the graph structure after interventions."""
+        self.interventions = frozenset(interventions)
 
-        # Start with a copy of the original graph
-        self._graph = self.original_graph._graph.copy()
+    @classmethod
+    def get(
+        cls, graph: CausalGraph, interventions: AbstractSet[str]
+    ) -> IntervenedGraph:
+        """Get a shared intervened view of a graph, creating it if needed.
 
-        # Remove all incoming edges to intervened variables
-        for var in self.interventions:
-            # Get all incoming edges
-            incoming = list(self._graph.predecessors(var))
-            for parent in incoming:
-                self._graph.remove_edge(parent, var)
+        Views are cached weakly by graph and intervention set, so repeated
+        queries on the same set reuse one view (and its cached snapshot) for
+        as long as anything still holds it.
 
-    def get_parents(self, node: str) -> Set[str]:
+        Args:
+            graph: The original CausalGraph
+            interventions: Set of variable names to intervene on
+        """
+        key = (id(graph), frozenset(interventions))
+        view = _VIEWS.get(key)
+        if view is None:
+            view = cls(graph, key[1])
+            _VIEWS[key] = view
+        return view
+
+    def get_parents(self, node: str) -> frozenset[str]:
         """Get parents after intervention."""
-        return set(self._graph.predecessors(node))
+        parents = self.original_graph.get_parents(node)
+        return frozenset() if node in self.interventions else parents
 
-    def get_children(self, node: str) -> Set[str]:
+    def get_children(self, node: str) -> frozenset[str]:
         """Get children after intervention."""
-        return set(self._graph.successors(node))
+        return self.original_graph.get_children(node) - self.interventions
 
-    def get_nodes(self) -> List[str]:
+    def get_nodes(self) -> list[str]:
         """Get all nodes."""
-        return list(self._graph.nodes())
+        return self.original_graph.get_nodes()
 
-    def get_edges(self) -> List[Tuple[str, str]]:
+    def get_edges(self) -> list[tuple[str, str]]:
         """Get all edges after intervention."""
-        return list(self._graph.edges())
+        interventions = self.interventions
+        return [
+            (u, v) for u, v in self.original_graph.get_edges() if v not in interventions
+        ]
+
+    def to_causal_graph(self) -> CausalGraph:
+        """Materialize the intervened graph as a standalone CausalGraph.
+
+        The edges are copied straight into the new graph's DiGraph with no
+        cycle checks, and the original topological order is reused: removing
+        edges never invalidates it.
+        """
+        from backend.graph import CausalGraph
+
+        original = self.original_graph
+        interventions = self.interventions
+        result = CausalGraph()
+        result._graph.add_nodes_from(original._graph)
+        result._graph.add_edges_from(
+            (u, v) for u, v in original._graph.edges() if v not in interventions
+        )
+        result._topo = original.get_topological_order()
+        return result
+
+    def is_d_separated(
+        self, x: AbstractSet[str], y: AbstractSet[str], z: AbstractSet[str]
+    ) -> bool:
+        """Check if X and Y are d-separated given Z after intervention."""
+        return self.original_graph._adjacency(self.interventions).is_d_separated(
+            x, y, z
+        )
 
     def __repr__(self) -> str:
         interventions_str = ", ".join(sorted(self.interventions))
         return f"IntervenedGraph(interventions=[{interventions_str}])"
+
+
+# A live view keeps its graph alive, so a graph's id cannot be reused while
+# an entry for it is still in here.
+_VIEWS: weakref.WeakValueDictionary[tuple[int, frozenset[str]], IntervenedGraph] = (
+    weakref.WeakValueDictionary()
+)
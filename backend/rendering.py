@@ -3,6 +3,11 @@
 Provides reusable ASCII diagram rendering for causal graphs.
 """
 
+import functools
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from itertools import starmap
+
 from backend.graph import CausalGraph
 
 
@@ -16,226 +21,338 @@ def render_graph_ascii(graph: CausalGraph, use_rich: bool = True) -> str:
     Returns:
         ASCII string representation of the graph
     """
-    nodes = graph.get_nodes()
+    style = _styler(use_rich)
     edges = graph.get_edges()
+    if 0 < len(edges) <= 2 and len(graph.get_nodes()) == len(edges) + 1:
+        # The common tutorial state: one edge, or a connected three-node graph
+        return _render_small(edges, style)
+
+    ctx = _context(graph)
 
-    if not nodes:
-        return _style("Empty graph", "dim", use_rich)
+    if not ctx.nodes:
+        return style("Empty graph", "dim")
 
-    if not edges:
+    if not ctx.sorted_edges:
         # Just isolated nodes
-        node_strs = [_style(f"({n})", "cyan", use_rich) for n in sorted(nodes)]
+        node_strs = [style(f"({n})", "cyan") for n in ctx.sorted_nodes]
         return "  ".join(node_strs)
 
     # Detect common patterns and render appropriately
     pattern = _detect_pattern(graph)
 
     if pattern == "chain":
-        return _render_chain(graph, use_rich)
+        return _render_chain(graph, ctx, style)
     elif pattern == "collider":
-        return _render_collider(graph, use_rich)
+        return _render_collider(graph, ctx, style)
     elif pattern == "fork":
-        return _render_fork(graph, use_rich)
+        return _render_fork(graph, ctx, style)
     else:
-        return _render_layered(graph, use_rich)
+        return _render_layered(graph, ctx, style)
+
 
+_Styler = Callable[[str, str], str]
 
-def _style(text: str, style: str, use_rich: bool) -> str:
-    """Apply Rich markup if enabled."""
-    if use_rich:
-        return f"[{style}]{text}[/{style}]"
+
+@functools.lru_cache(maxsize=4096)
+def _rich_style(text: str, style: str) -> str:
+    """Wrap text in Rich markup.
+
+    Memoized: renders reuse a handful of styles over the same node names
+    and arrows, so repeat calls return the already-built string.
+    """
+    return f"[{style}]{text}[/{style}]"
+
+
+def _plain_style(text: str, style: str) -> str:
+    """Leave text unstyled, for output without Rich markup."""
     return text
 
 
+def _styler(use_rich: bool) -> _Styler:
+    """Pick the styling function once per render."""
+    return _rich_style if use_rich else _plain_style
+
+
+@dataclass(slots=True, frozen=True)
+class _RenderContext:
+    """Graph state shared by the renderers, computed once per graph version.
+
+    Attributes:
+        nodes: Nodes in insertion order
+        sorted_nodes: Nodes in sorted order
+        sorted_edges: Edges in sorted order
+        in_degree: Number of parents of each node
+        out_degree: Number of children of each node
+        labels: Styled node names, per styling function
+        edge_lists: Joined "P → C" edge list, per styling function
+    """
+
+    nodes: tuple[str, ...]
+    sorted_nodes: tuple[str, ...]
+    sorted_edges: tuple[tuple[str, str], ...]
+    in_degree: dict[str, int]
+    out_degree: dict[str, int]
+    labels: dict[_Styler, dict[str, str]] = field(default_factory=dict)
+    edge_lists: dict[_Styler, str] = field(default_factory=dict)
+
+    def node_labels(self, style: _Styler) -> dict[str, str]:
+        """Get every node name styled as a node, built once per styler."""
+        labels = self.labels.get(style)
+        if labels is None:
+            labels = self.labels[style] = {n: style(n, "cyan") for n in self.nodes}
+        return labels
+
+    def edge_list(self, style: _Styler) -> str:
+        """Get the sorted edges joined as "P → C" pairs, built once per styler."""
+        edge_list = self.edge_lists.get(style)
+        if edge_list is None:
+            template = f"{{}} {style('→', 'yellow')} {{}}".format
+            edge_list = ", ".join(starmap(template, self.sorted_edges))
+            self.edge_lists[style] = edge_list
+        return edge_list
+
+
+def _context(graph: CausalGraph) -> _RenderContext:
+    """Get the render context for a graph, cached until the graph changes."""
+    key = ("render_context",)
+    if key not in graph._cache:
+        nodes = tuple(graph.get_nodes())
+        edges = graph.get_sorted_edges()
+        in_degree: dict[str, int] = {n: 0 for n in nodes}
+        out_degree: dict[str, int] = {n: 0 for n in nodes}
+
+        for parent, child in edges:
+            out_degree[parent] += 1
+            in_degree[child] += 1
+        graph._cache[key] = _RenderContext(
+            nodes=nodes,
+            sorted_nodes=tuple(sorted(nodes)),
+            sorted_edges=edges,
+            in_degree=in_degree,
+            out_degree=out_degree,
+        )
+    return graph._cache[key]
+
+
 def _detect_pattern(graph: CausalGraph) -> str:
-    """Detect common causal patterns."""
-    nodes = graph.get_nodes()
-    edges = graph.get_edges()
+    """Detect common causal patterns, cached until the graph changes."""
+    key = ("render_pattern",)
+    if key not in graph._cache:
+        graph._cache[key] = _classify(graph)
+    return graph._cache[key]
 
-    if len(nodes) <= 1:
-        return "simple"
 
-    # Count in-degree and out-degree for each node
-    in_degree: dict[str, int] = {n: 0 for n in nodes}
-    out_degree: dict[str, int] = {n: 0 for n in nodes}
+def _classify(graph: CausalGraph) -> str:
+    """Classify the graph as a chain, collider, fork or complex pattern."""
+    ctx = _context(graph)
 
-    for parent, child in edges:
-        out_degree[parent] = out_degree.get(parent, 0) + 1
-        in_degree[child] = in_degree.get(child, 0) + 1
+    if len(ctx.nodes) <= 1:
+        return "simple"
 
-    # Chain: linear sequence (each node has at most 1 parent and 1 child)
-    if all(in_degree[n] <= 1 and out_degree[n] <= 1 for n in nodes):
-        return "chain"
+    in_degree, out_degree = ctx.in_degree, ctx.out_degree
 
+    # Chain: linear sequence (each node has at most 1 parent and 1 child)
     # Collider: one node with multiple parents, no children from those parents
-    for n in nodes:
-        if in_degree[n] >= 2 and out_degree[n] == 0:
-            parents = graph.get_parents(n)
-            if all(out_degree[p] == 1 for p in parents):
+    # Fork: one node with multiple children, no parents
+    # Colliders and forks are never chains, so one pass settles all three;
+    # a collider anywhere still takes precedence over a fork.
+    is_chain = True
+    fork = None
+    for n in ctx.nodes:
+        n_in, n_out = in_degree[n], out_degree[n]
+        if n_in <= 1 and n_out <= 1:
+            continue
+        is_chain = False
+        if n_in >= 2 and n_out == 0:
+            if all(out_degree[p] == 1 for p in graph.get_parents(n)):
                 return "collider"
+        elif (
+            fork is None
+            and n_out >= 2
+            and n_in == 0
+            and all(in_degree[c] == 1 for c in graph.get_children(n))
+        ):
+            fork = n
 
-    # Fork: one node with multiple children, no parents
-    for n in nodes:
-        if out_degree[n] >= 2 and in_degree[n] == 0:
-            children = graph.get_children(n)
-            if all(in_degree[c] == 1 for c in children):
-                return "fork"
+    if is_chain:
+        return "chain"
+    if fork is not None:
+        return "fork"
 
     return "complex"
 
 
-def _render_chain(graph: CausalGraph, use_rich: bool) -> str:
-    """Render a chain pattern horizontally: X → Y → Z"""
-    nodes = graph.get_nodes()
+def _render_small(edges: list[tuple[str, str]], style: _Styler) -> str:
+    """Render a connected graph of one or two edges without pattern detection.
+
+    Produces the same output as the chain, collider and fork renderers.
+    """
+    arrow = style(" → ", "dim")
+    if len(edges) == 1:
+        ((parent, child),) = edges
+        return f"{style(parent, 'cyan')}{arrow}{style(child, 'cyan')}"
+
+    (a, b), (c, d) = sorted(edges)
+    arrow_back = style(" ← ", "dim")
+    if b == c:
+        # Chain: a → b → d
+        path = (a, b, d)
+    elif d == a:
+        # Chain: c → a → b
+        path = (c, a, b)
+    elif b == d:
+        # Collider: a → b ← c
+        return (
+            f"{style(a, 'cyan')}{arrow}{style(b, 'cyan')}{arrow_back}{style(c, 'cyan')}"
+        )
+    else:
+        # Fork: b ← a → d
+        return (
+            f"{style(b, 'cyan')}{arrow_back}{style(a, 'cyan')}{arrow}{style(d, 'cyan')}"
+        )
+    return arrow.join([style(n, "cyan") for n in path])
+
 
+def _render_chain(graph: CausalGraph, ctx: _RenderContext, style: _Styler) -> str:
+    """Render a chain pattern horizontally: X → Y → Z"""
     # Find the root (no parents)
-    roots = [n for n in nodes if not graph.get_parents(n)]
-    if not roots:
-        return _render_layered(graph, use_rich)
+    root = next((n for n in ctx.nodes if not ctx.in_degree[n]), None)
+    if root is None:
+        return _render_layered(graph, ctx, style)
 
-    # Build chain by following edges
-    chain = [roots[0]]
-    current = roots[0]
+    # Smallest child of each parent; edges are sorted, so the first seen wins
+    first_child: dict[str, str] = {}
+    for parent, child in ctx.sorted_edges:
+        first_child.setdefault(parent, child)
 
-    while True:
-        children = graph.get_children(current)
-        if not children:
-            break
-        next_node = sorted(children)[0]
-        chain.append(next_node)
-        current = next_node
+    # Build chain by following edges
+    chain = [root]
+    current = root
+    while current in first_child:
+        current = first_child[current]
+        chain.append(current)
 
     # Render horizontally
-    arrow = _style(" → ", "dim", use_rich)
-    node_strs = [_style(n, "cyan", use_rich) for n in chain]
+    labels = ctx.node_labels(style)
+    arrow = style(" → ", "dim")
+    node_strs = [labels[n] for n in chain]
     return arrow.join(node_strs)
 
 
-def _render_collider(graph: CausalGraph, use_rich: bool) -> str:
+def _render_collider(graph: CausalGraph, ctx: _RenderContext, style: _Styler) -> str:
     """Render a collider pattern: X → Y ← Z"""
-    nodes = graph.get_nodes()
-
     # Find the collider node (multiple parents)
     collider = None
-    for n in nodes:
-        if len(graph.get_parents(n)) >= 2:
+    for n in ctx.nodes:
+        if ctx.in_degree[n] >= 2:
             collider = n
             break
 
     if not collider:
-        return _render_layered(graph, use_rich)
+        return _render_layered(graph, ctx, style)
 
+    labels = ctx.node_labels(style)
     parents = sorted(graph.get_parents(collider))
-    arrow_in = _style(" → ", "dim", use_rich)
-    arrow_back = _style(" ← ", "dim", use_rich)
-    collider_styled = _style(collider, "cyan", use_rich)
+    arrow_in = style(" → ", "dim")
+    arrow_back = style(" ← ", "dim")
+    collider_styled = labels[collider]
 
     if len(parents) == 2:
         # Simple two-parent collider: X → Y ← Z
-        left = _style(parents[0], "cyan", use_rich)
-        right = _style(parents[1], "cyan", use_rich)
+        left = labels[parents[0]]
+        right = labels[parents[1]]
         return f"{left}{arrow_in}{collider_styled}{arrow_back}{right}"
     else:
         # Multiple parents: show as list
-        parent_strs = [_style(p, "cyan", use_rich) for p in parents]
+        parent_strs = [labels[p] for p in parents]
         return f"{', '.join(parent_strs)}{arrow_in}{collider_styled}"
 
 
-def _render_fork(graph: CausalGraph, use_rich: bool) -> str:
+def _render_fork(graph: CausalGraph, ctx: _RenderContext, style: _Styler) -> str:
     """Render a fork pattern: X ← Z → Y"""
-    nodes = graph.get_nodes()
-
     # Find the fork node (multiple children, no parents)
     fork = None
-    for n in nodes:
-        if len(graph.get_children(n)) >= 2 and not graph.get_parents(n):
+    for n in ctx.nodes:
+        if ctx.out_degree[n] >= 2 and not ctx.in_degree[n]:
             fork = n
             break
 
     if not fork:
-        return _render_layered(graph, use_rich)
+        return _render_layered(graph, ctx, style)
 
+    labels = ctx.node_labels(style)
     children = sorted(graph.get_children(fork))
-    arrow_out = _style(" → ", "dim", use_rich)
-    arrow_back = _style(" ← ", "dim", use_rich)
-    fork_styled = _style(fork, "cyan", use_rich)
+    arrow_out = style(" → ", "dim")
+    arrow_back = style(" ← ", "dim")
+    fork_styled = labels[fork]
 
     if len(children) == 2:
         # Simple two-child fork: X ← Z → Y
-        left = _style(children[0], "cyan", use_rich)
-        right = _style(children[1], "cyan", use_rich)
+        left = labels[children[0]]
+        right = labels[children[1]]
         return f"{left}{arrow_back}{fork_styled}{arrow_out}{right}"
     else:
         # Multiple children: show as list
-        child_strs = [_style(c, "cyan", use_rich) for c in children]
+        child_strs = [labels[c] for c in children]
         return f"{fork_styled}{arrow_out}{', '.join(child_strs)}"
 
 
-def _render_layered(graph: CausalGraph, use_rich: bool) -> str:
+def _render_layered(graph: CausalGraph, ctx: _RenderContext, style: _Styler) -> str:
     """Render complex graphs with layers and edge list."""
-    edges = graph.get_edges()
+    labels = ctx.node_labels(style)
     layers = _get_layers(graph)
 
     lines = []
 
-    # Show nodes by layer
-    for i, layer in enumerate(layers):
-        prefix = _style(f"L{i + 1}: ", "dim", use_rich)
-        node_strs = [_style(n, "cyan", use_rich) for n in sorted(layer)]
-        lines.append(prefix + "  ".join(node_strs))
+    # Show nodes by layer (each layer is already sorted)
+    for i, layer in enumerate(layers, 1):
+        prefix = style(f"L{i}: ", "dim")
+        lines.append(prefix + "  ".join([labels[n] for n in layer]))
 
     # Show edges
-    if edges:
+    if ctx.sorted_edges:
         lines.append("")
-        arrow = _style("→", "yellow", use_rich)
-        edge_strs = [f"{p} {arrow} {c}" for p, c in sorted(edges)]
-        lines.append(_style("Edges: ", "dim", use_rich) + ", ".join(edge_strs))
+        lines.append(style("Edges: ", "dim") + ctx.edge_list(style))
 
     return "\n".join(lines)
 
 
 def _get_layers(graph: CausalGraph) -> list[list[str]]:
-    """Get nodes organized into layers (roots first, then children, etc.)."""
-    nodes = set(graph.get_nodes())
-    layers: list[list[str]] = []
-    placed: set[str] = set()
-
-    # First layer: roots (no parents)
-    roots = [n for n in nodes if not graph.get_parents(n)]
-    if roots:
-        layers.append(sorted(roots))
-        placed.update(roots)
-    elif nodes:
-        # No roots (cycle?), just pick first alphabetically
-        first = sorted(nodes)[0]
-        layers.append([first])
-        placed.add(first)
-
-    # Subsequent layers: nodes whose parents are all placed
-    while placed != nodes:
-        next_layer = []
-        for n in nodes - placed:
-            parents = graph.get_parents(n)
-            if parents <= placed:  # All parents are placed
-                next_layer.append(n)
-
-        if next_layer:
-            layers.append(sorted(next_layer))
-            placed.update(next_layer)
-        else:
-            # Remaining nodes have unplaceable dependencies, add them
-            remaining = sorted(nodes - placed)
-            layers.append(remaining)
-            placed.update(remaining)
+    """Get nodes organized into layers (roots first, then children, etc.).
+
+    A node's layer is one past the deepest of its parents: the longest path
+    to it from a root, found in a single pass over the topological order.
+    Cached until the graph changes.
+    """
+    key = ("render_layers",)
+    if key not in graph._cache:
+        graph._cache[key] = _compute_layers(graph)
+    return graph._cache[key]
+
+
+def _compute_layers(graph: CausalGraph) -> list[list[str]]:
+    """Bucket nodes by their longest-path depth from a root."""
+    ctx = _context(graph)
+    order = graph.get_topological_order()
+    depth = dict.fromkeys(order, 0)
+    for n in order:
+        child_depth = depth[n] + 1
+        for c in graph.get_children(n):
+            depth[c] = max(depth[c], child_depth)
+
+    # Bucket the sorted nodes by depth, so each layer comes out sorted
+    layers: list[list[str]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+    for n in ctx.sorted_nodes:
+        layers[depth[n]].append(n)
 
     return layers
 
 
 def render_edges_list(graph: CausalGraph, use_rich: bool = True) -> str:
     """Render just the edges as a simple list."""
-    edges = graph.get_edges()
-    if not edges:
-        return _style("No edges", "dim", use_rich)
+    style = _styler(use_rich)
+    ctx = _context(graph)
+    if not ctx.sorted_edges:
+        return style("No edges", "dim")
 
-    arrow = _style("→", "yellow", use_rich)
-    return ", ".join(f"{p} {arrow} {c}" for p, c in sorted(edges))
+    return ctx.edge_list(style)
@@ -1,12 +1,31 @@
 """Interactive tutorial system for learning causal inference."""
 
-from backend.tutorial.models import (
-    Lesson,
-    TutorialStep,
-    TutorialState,
-    TutorialResponse,
-)
-from backend.tutorial.engine import TutorialEngine
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from backend.tutorial.content import get_all_lessons, get_lesson_by_id
+    from backend.tutorial.engine import TutorialEngine
+    from backend.tutorial.models import (
+        Lesson,
+        TutorialResponse,
+        TutorialState,
+        TutorialStep,
+    )
+
+# Public names are imported on first access, so that loading the models or
+# a single lesson does not import the engine and its graph dependencies.
+_EXPORTS = {
+    "Lesson": "backend.tutorial.models",
+    "TutorialStep": "backend.tutorial.models",
+    "TutorialState": "backend.tutorial.models",
+    "TutorialResponse": "backend.tutorial.models",
+    "TutorialEngine": "backend.tutorial.engine",
+    "get_all_lessons": "backend.tutorial.content",
+    "get_lesson_by_id": "backend.tutorial.content",
+}
 
 __all__ = [
     "Lesson",
@@ -14,4 +33,14 @@ __all__ = [
     "TutorialState",
     "TutorialResponse",
     "TutorialEngine",
+    "get_all_lessons",
+    "get_lesson_by_id",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
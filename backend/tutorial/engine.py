@@ -1,6 +1,7 @@
 """Tutorial engine - manages lesson flow and user state."""
 
 import re
+from collections.abc import Callable
 from typing import Optional
 
 from backend.graph import CausalGraph
@@ -13,6 +14,45 @@ from backend.tutorial.models import (
     TutorialStep,
 )
 
+# Tutorial commands, compiled once rather than looked up per keystroke
+_ADD_EDGE_RE = re.compile(r"add\s+edge\s+(\w+)\s+(\w+)")
+_ADD_NODE_RE = re.compile(r"add\s+node\s+(\w+)")
+_REMOVE_EDGE_RE = re.compile(r"remove\s+edge\s+(\w+)\s+(\w+)")
+_DSEP_RE = re.compile(r"dsep\s+(\w+)\s+(\w+)(?:\s+given\s+(.+))?")
+_PATHS_RE = re.compile(r"paths\s+(\w+)\s+(\w+)")
+_DO_RE = re.compile(r"do\s+(.+)")
+_PARENTS_RE = re.compile(r"parents\s+(\w+)")
+_CHILDREN_RE = re.compile(r"children\s+(\w+)")
+
+# Inputs handled by handle_input itself rather than parsed as commands
+_NAVIGATION_COMMANDS = frozenset({"hint", "skip", "show", "quit", "exit", "q"})
+
+# Responses that never vary, shared rather than rebuilt on every input
+_NO_LESSON_RESPONSE = TutorialResponse(
+    success=False,
+    message="No active lesson. Use 'archy learn <lesson>' to start.",
+)
+_SHOW_RESPONSE = TutorialResponse(
+    success=True, message="Current graph:", show_graph=True
+)
+_QUIT_RESPONSE = TutorialResponse(
+    success=True, message="Tutorial paused. Use --resume to continue."
+)
+_LESSON_COMPLETE_RESPONSE = TutorialResponse(
+    success=False, message="Lesson complete!", advance=False
+)
+
+# Command format to suggest for each expected action
+_COMMAND_HINTS = {
+    StepAction.ADD_EDGE: "add edge X Y",
+    StepAction.ADD_NODE: "add node X",
+    StepAction.REMOVE_EDGE: "remove edge X Y",
+    StepAction.CHECK_DSEP: "dsep X Y [given Z]",
+    StepAction.CHECK_PATHS: "paths X Y",
+    StepAction.APPLY_DO: "do X",
+    StepAction.SHOW_GRAPH: "show, parents X, or children X",
+}
+
 
 class TutorialEngine:
     """Manages tutorial flow, state, and user input processing."""
@@ -50,9 +90,7 @@ class TutorialEngine:
         """Get the current step in the lesson."""
         if not self.current_lesson or not self.state:
             return None
-        if self.state.step_index >= len(self.current_lesson.steps):
-            return None
-        return self.current_lesson.steps[self.state.step_index]
+        return _step_at(self.current_lesson, self.state)
 
     def get_hint(self) -> str:
         """Get hint for current step."""
@@ -62,46 +100,48 @@ class TutorialEngine:
         return step.hint
 
     def handle_input(self, user_input: str) -> TutorialResponse:
-        """Process user input and return response."""
-        if not self.state or not self.current_lesson:
-            return TutorialResponse(
-                success=False,
-                message="No active lesson. Use 'archy learn <lesson>' to start.",
-            )
+        """Process user input and return response.
 
-        user_input = user_input.strip().lower()
+        This is the one place that checks for an active lesson; the lesson
+        and state are passed down from here rather than re-checked.
+        """
+        lesson, state = self.current_lesson, self.state
+        if not state or not lesson:
+            return _NO_LESSON_RESPONSE
+
+        # Navigation commands are nearly always typed in lowercase already,
+        # so only other input pays for a lowercased copy
+        user_input = user_input.strip()
+        if user_input not in _NAVIGATION_COMMANDS:
+            user_input = user_input.lower()
 
         # Handle navigation commands
         if user_input == "hint":
             return TutorialResponse(success=True, message=self.get_hint())
         if user_input == "skip":
-            return self._advance_step(skipped=True)
+            return self._advance_step(lesson, state, skipped=True)
         if user_input == "show":
-            return TutorialResponse(
-                success=True, message="Current graph:", show_graph=True
-            )
+            return _SHOW_RESPONSE
         if user_input in ("quit", "exit", "q"):
-            return TutorialResponse(
-                success=True, message="Tutorial paused. Use --resume to continue."
-            )
+            return _QUIT_RESPONSE
 
         # Parse and execute command
-        return self._execute_command(user_input)
+        return self._execute_command(user_input, lesson, state)
 
-    def _execute_command(self, cmd: str) -> TutorialResponse:
+    def _execute_command(
+        self, cmd: str, lesson: Lesson, state: TutorialState
+    ) -> TutorialResponse:
         """Parse and execute a tutorial command."""
-        step = self.get_current_step()
+        step = _step_at(lesson, state)
         if not step:
-            return TutorialResponse(
-                success=False, message="Lesson complete!", advance=False
-            )
+            return _LESSON_COMPLETE_RESPONSE
 
         # Parse command
         parsed = self._parse_command(cmd)
         if not parsed:
+            expected = _COMMAND_HINTS.get(step.expected_action, "hint")
             return TutorialResponse(
-                success=False,
-                message=f"Unknown command. Try: {self._get_expected_command_hint(step)}",
+                success=False, message=f"Unknown command. Try: {expected}"
             )
 
         action, args = parsed
@@ -112,16 +152,13 @@ class TutorialEngine:
             return result
 
         # Validate against expected
-        if not self.state:
-            return TutorialResponse(success=False, message="No active lesson.")
-
         if self._validate_step(step, action, args):
-            self.state.attempts = 0
-            return self._advance_step()
+            state.attempts = 0
+            return self._advance_step(lesson, state)
         else:
-            self.state.attempts += 1
+            state.attempts += 1
             hint_msg = ""
-            if self.state.attempts >= 2:
+            if state.attempts >= 2:
                 hint_msg = f"\n\nHint: {step.hint}"
             return TutorialResponse(
                 success=False,
@@ -130,64 +167,18 @@ class TutorialEngine:
             )
 
     def _parse_command(self, cmd: str) -> Optional[tuple[StepAction, dict]]:
-        """Parse user command into action and arguments."""
-        # add edge X Y
-        match = re.match(r"add\s+edge\s+(\w+)\s+(\w+)", cmd)
-        if match:
-            return StepAction.ADD_EDGE, {
-                "parent": match.group(1),
-                "child": match.group(2),
-            }
-
-        # add node X
-        match = re.match(r"add\s+node\s+(\w+)", cmd)
-        if match:
-            return StepAction.ADD_NODE, {"node": match.group(1)}
-
-        # remove edge X Y
-        match = re.match(r"remove\s+edge\s+(\w+)\s+(\w+)", cmd)
-        if match:
-            return StepAction.REMOVE_EDGE, {
-                "parent": match.group(1),
-                "child": match.group(2),
-            }
-
-        # dsep X Y [given Z [W ...]]
-        match = re.match(r"dsep\s+(\w+)\s+(\w+)(?:\s+given\s+(.+))?", cmd)
-        if match:
-            given: list[str] = []
-            if match.group(3):
-                given = match.group(3).split()
-            return StepAction.CHECK_DSEP, {
-                "x": match.group(1),
-                "y": match.group(2),
-                "given": given,
-            }
-
-        # paths X Y
-        match = re.match(r"paths\s+(\w+)\s+(\w+)", cmd)
-        if match:
-            return StepAction.CHECK_PATHS, {
-                "treatment": match.group(1),
-                "outcome": match.group(2),
-            }
-
-        # do X [Y ...]
-        match = re.match(r"do\s+(.+)", cmd)
-        if match:
-            variables = match.group(1).split()
-            return StepAction.APPLY_DO, {"variables": variables}
-
-        # parents X / children X
-        match = re.match(r"parents\s+(\w+)", cmd)
-        if match:
-            return StepAction.SHOW_GRAPH, {"query": "parents", "node": match.group(1)}
-
-        match = re.match(r"children\s+(\w+)", cmd)
-        if match:
-            return StepAction.SHOW_GRAPH, {"query": "children", "node": match.group(1)}
-
-        return None
+        """Parse user command into action and arguments.
+
+        The first word selects the command, so only that command's parser
+        sees the input. Well-formed commands are read straight from their
+        words; anything else falls back to the command's pattern.
+        """
+        words = cmd.split()
+        if not words or cmd[0].isspace():
+            # Every command pattern starts with its keyword
+            return None
+        parser = _COMMAND_PARSERS.get(words[0])
+        return parser(cmd, words) if parser else None
 
     def _apply_action(self, action: StepAction, args: dict) -> TutorialResponse:
         """Apply an action to the current graph."""
@@ -195,7 +186,7 @@ class TutorialEngine:
             self.graph = CausalGraph(edges=[])
 
         try:
-            if action == StepAction.ADD_EDGE:
+            if action is StepAction.ADD_EDGE:
                 self.graph.add_edge(args["parent"], args["child"])
                 return TutorialResponse(
                     success=True,
@@ -203,14 +194,14 @@ class TutorialEngine:
                     show_graph=True,
                 )
 
-            elif action == StepAction.ADD_NODE:
+            elif action is StepAction.ADD_NODE:
                 # Add isolated node by adding to graph
-                self.graph._graph.add_node(args["node"])
+                self.graph.add_node(args["node"])
                 return TutorialResponse(
                     success=True, message=f"Added node: {args['node']}", show_graph=True
                 )
 
-            elif action == StepAction.REMOVE_EDGE:
+            elif action is StepAction.REMOVE_EDGE:
                 self.graph.remove_edge(args["parent"], args["child"])
                 return TutorialResponse(
                     success=True,
@@ -218,7 +209,7 @@ class TutorialEngine:
                     show_graph=True,
                 )
 
-            elif action == StepAction.CHECK_DSEP:
+            elif action is StepAction.CHECK_DSEP:
                 x_set = {args["x"]}
                 y_set = {args["y"]}
                 z_set = set(args.get("given", []))
@@ -230,7 +221,7 @@ class TutorialEngine:
                     message=f"{args['x']} {symbol} {args['y']}{given_str}",
                 )
 
-            elif action == StepAction.CHECK_PATHS:
+            elif action is StepAction.CHECK_PATHS:
                 paths = self.graph.get_backdoor_paths(
                     args["treatment"], args["outcome"]
                 )
@@ -243,7 +234,7 @@ class TutorialEngine:
                     )
                 return TutorialResponse(success=True, message=msg)
 
-            elif action == StepAction.APPLY_DO:
+            elif action is StepAction.APPLY_DO:
                 variables = set(args.get("variables", []))
                 if not variables:
                     return TutorialResponse(
@@ -251,8 +242,7 @@ class TutorialEngine:
                     )
                 # Apply intervention - this removes incoming edges to intervened vars
                 intervened = IntervenedGraph(self.graph, variables)
-                # Create new CausalGraph from intervened edges
-                self.graph = CausalGraph(edges=intervened.get_edges())
+                self.graph = intervened.to_causal_graph()
                 var_str = ", ".join(sorted(variables))
                 return TutorialResponse(
                     success=True,
@@ -260,7 +250,7 @@ class TutorialEngine:
                     show_graph=True,
                 )
 
-            elif action == StepAction.SHOW_GRAPH:
+            elif action is StepAction.SHOW_GRAPH:
                 if args.get("query") == "parents":
                     parents = self.graph.get_parents(args["node"])
                     return TutorialResponse(
@@ -288,43 +278,38 @@ class TutorialEngine:
             return step.validator(self.graph, action, args)
 
         # Check action type matches
-        if action != step.expected_action:
+        if action is not step.expected_action:
             return False
 
-        # Check arguments match (case-insensitive for node names)
-        expected = step.expected_args
-        for key, value in expected.items():
+        # Check arguments match (case-insensitive for node names). The
+        # expected side is pre-lowercased on the step, and handle_input has
+        # already lowercased the user's command.
+        for key, value in step.normalized_args:
             if key not in args:
                 return False
-            if isinstance(value, str):
-                if args[key].lower() != value.lower():
-                    return False
-            elif isinstance(value, list):
-                if sorted(a.lower() for a in args[key]) != sorted(
-                    v.lower() for v in value
-                ):
+            if isinstance(value, tuple):
+                if tuple(sorted(args[key])) != value:
                     return False
             elif args[key] != value:
                 return False
 
         return True
 
-    def _advance_step(self, skipped: bool = False) -> TutorialResponse:
+    def _advance_step(
+        self, lesson: Lesson, state: TutorialState, skipped: bool = False
+    ) -> TutorialResponse:
         """Move to the next step in the lesson."""
-        if not self.state or not self.current_lesson:
-            return TutorialResponse(success=False, message="No active lesson.")
-
-        step = self.get_current_step()
+        step = _step_at(lesson, state)
         explanation = ""
         if step and step.explanation and not skipped:
             explanation = f"\n\n{step.explanation}"
 
-        self.state.completed_steps.append(self.state.step_index)
-        self.state.step_index += 1
+        state.completed_count += 1
+        state.step_index += 1
 
         # Check if lesson complete
-        if self.state.step_index >= len(self.current_lesson.steps):
-            self.state.completed = True
+        if state.step_index >= len(lesson.steps):
+            state.completed = True
             return TutorialResponse(
                 success=True,
                 message=f"Lesson complete!{explanation}",
@@ -338,19 +323,6 @@ class TutorialEngine:
             show_graph=True,
         )
 
-    def _get_expected_command_hint(self, step: TutorialStep) -> str:
-        """Generate hint for expected command format."""
-        hints = {
-            StepAction.ADD_EDGE: "add edge X Y",
-            StepAction.ADD_NODE: "add node X",
-            StepAction.REMOVE_EDGE: "remove edge X Y",
-            StepAction.CHECK_DSEP: "dsep X Y [given Z]",
-            StepAction.CHECK_PATHS: "paths X Y",
-            StepAction.APPLY_DO: "do X",
-            StepAction.SHOW_GRAPH: "show, parents X, or children X",
-        }
-        return hints.get(step.expected_action, "hint")
-
     def save_state(self) -> dict:
         """Serialize current state for persistence."""
         if not self.state:
@@ -378,3 +350,131 @@ class TutorialEngine:
             self.graph = CausalGraph(edges=[])
 
         return True
+
+
+def _step_at(lesson: Lesson, state: TutorialState) -> Optional[TutorialStep]:
+    """Get the lesson step the state points at, or None past the last one."""
+    if state.step_index >= len(lesson.steps):
+        return None
+    return lesson.steps[state.step_index]
+
+
+_ParsedCommand = Optional[tuple[StepAction, dict]]
+
+
+def _parse_add(cmd: str, words: list[str]) -> _ParsedCommand:
+    # add edge X Y
+    if (
+        len(words) == 4
+        and words[1] == "edge"
+        and words[2].isalnum()
+        and words[3].isalnum()
+    ):
+        return StepAction.ADD_EDGE, {"parent": words[2], "child": words[3]}
+    match = _ADD_EDGE_RE.match(cmd)
+    if match:
+        return StepAction.ADD_EDGE, {
+            "parent": match.group(1),
+            "child": match.group(2),
+        }
+
+    # add node X
+    if len(words) == 3 and words[1] == "node" and words[2].isalnum():
+        return StepAction.ADD_NODE, {"node": words[2]}
+    match = _ADD_NODE_RE.match(cmd)
+    if match:
+        return StepAction.ADD_NODE, {"node": match.group(1)}
+    return None
+
+
+def _parse_remove(cmd: str, words: list[str]) -> _ParsedCommand:
+    # remove edge X Y
+    if (
+        len(words) == 4
+        and words[1] == "edge"
+        and words[2].isalnum()
+        and words[3].isalnum()
+    ):
+        return StepAction.REMOVE_EDGE, {"parent": words[2], "child": words[3]}
+    match = _REMOVE_EDGE_RE.match(cmd)
+    if match:
+        return StepAction.REMOVE_EDGE, {
+            "parent": match.group(1),
+            "child": match.group(2),
+        }
+    return None
+
+
+def _parse_dsep(cmd: str, words: list[str]) -> _ParsedCommand:
+    # dsep X Y
+    if len(words) == 3 and words[1].isalnum() and words[2].isalnum():
+        return StepAction.CHECK_DSEP, {"x": words[1], "y": words[2], "given": []}
+
+    # dsep X Y [given Z [W ...]]
+    match = _DSEP_RE.match(cmd)
+    if match:
+        given: list[str] = []
+        if match.group(3):
+            given = match.group(3).split()
+        return StepAction.CHECK_DSEP, {
+            "x": match.group(1),
+            "y": match.group(2),
+            "given": given,
+        }
+    return None
+
+
+def _parse_paths(cmd: str, words: list[str]) -> _ParsedCommand:
+    # paths X Y
+    if len(words) == 3 and words[1].isalnum() and words[2].isalnum():
+        return StepAction.CHECK_PATHS, {"treatment": words[1], "outcome": words[2]}
+    match = _PATHS_RE.match(cmd)
+    if match:
+        return StepAction.CHECK_PATHS, {
+            "treatment": match.group(1),
+            "outcome": match.group(2),
+        }
+    return None
+
+
+def _parse_do(cmd: str, words: list[str]) -> _ParsedCommand:
+    # do X [Y ...]; the pattern's "." stops at a newline, the words don't
+    if len(words) > 1 and "\n" not in cmd:
+        return StepAction.APPLY_DO, {"variables": words[1:]}
+    match = _DO_RE.match(cmd)
+    if match:
+        variables = match.group(1).split()
+        return StepAction.APPLY_DO, {"variables": variables}
+    return None
+
+
+def _parse_parents(cmd: str, words: list[str]) -> _ParsedCommand:
+    # parents X
+    if len(words) == 2 and words[1].isalnum():
+        return StepAction.SHOW_GRAPH, {"query": "parents", "node": words[1]}
+    match = _PARENTS_RE.match(cmd)
+    if match:
+        return StepAction.SHOW_GRAPH, {"query": "parents", "node": match.group(1)}
+    return None
+
+
+def _parse_children(cmd: str, words: list[str]) -> _ParsedCommand:
+    # children X
+    if len(words) == 2 and words[1].isalnum():
+        return StepAction.SHOW_GRAPH, {"query": "children", "node": words[1]}
+    match = _CHILDREN_RE.match(cmd)
+    if match:
+        return StepAction.SHOW_GRAPH, {"query": "children", "node": match.group(1)}
+    return None
+
+
+# Command keyword -> parser for the input and its words
+_COMMAND_PARSERS: dict[str, Callable[[str, list[str]], _ParsedCommand]] = {
+    "add": _parse_add,
+    "remove": _parse_remove,
+    "dsep": _parse_dsep,
+    "paths": _parse_paths,
+    "do": _parse_do,
+    "parents": _parse_parents,
+    "children": _parse_children,
+}
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 
 class CausalLevel(Enum):
@@ -37,41 +37,76 @@ class StepAction(Enum):
     ANSWER_QUESTION = "answer_question"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TutorialStep:
-    """A single step in a tutorial lesson."""
+    """A single step in a tutorial lesson.
+
+    Steps are static lesson content, so they are slotted and immutable.
+    The hint defaults to "Type: <example>", which is what nearly every step
+    would otherwise spell out by hand. Expected arguments are also kept
+    lowercased (and list values sorted) for case-insensitive validation.
+    """
 
     instruction: str  # What the user should understand
     prompt: str  # The task or question
-    hint: str  # Help if user is stuck
     expected_action: StepAction  # What type of action to validate
-    expected_args: dict = field(default_factory=dict)  # Arguments for validation
+    expected_args: tuple[tuple[str, Any], ...] = ()  # (name, value) pairs to validate
     example: str = ""  # Example command shown below prompt
     explanation: str = ""  # Why this matters (shown after success)
     validator: Optional[Callable] = None  # Custom validation function
+    hint: str = ""  # Help if user is stuck
+    normalized_args: tuple[tuple[str, Any], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if not self.hint and self.example:
+            object.__setattr__(self, "hint", f"Type: {self.example}")
+        object.__setattr__(
+            self,
+            "normalized_args",
+            tuple((key, _normalize_arg(value)) for key, value in self.expected_args),
+        )
+
+
+def _normalize_arg(value: Any) -> Any:
+    """Lowercase a string argument, or sort and lowercase a tuple of them."""
+    if isinstance(value, str):
+        return value.lower()
+    if isinstance(value, tuple):
+        return tuple(sorted(v.lower() for v in value))
+    return value
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Lesson:
-    """A complete tutorial lesson."""
+    """A complete tutorial lesson.
+
+    Lessons are static content shared by every engine, so they are slotted
+    and immutable.
+    """
 
     id: str
     title: str
     description: str
     level: CausalLevel
     causal_type: Optional[CausalType] = None
-    steps: list[TutorialStep] = field(default_factory=list)
-    prerequisites: list[str] = field(default_factory=list)  # Lesson IDs
+    steps: tuple[TutorialStep, ...] = ()
+    prerequisites: tuple[str, ...] = ()  # Lesson IDs
 
 
-@dataclass
+@dataclass(slots=True)
 class TutorialState:
-    """Current state of a tutorial session."""
+    """Current state of a tutorial session.
+
+    The engine updates this in place as the user progresses, so unlike the
+    lesson content it stays mutable.
+    """
 
     lesson_id: str
     step_index: int = 0
     graph_state: dict = field(default_factory=dict)  # Serialized graph
-    completed_steps: list[int] = field(default_factory=list)
+    completed_count: int = 0  # Steps finished or skipped so far
     attempts: int = 0
     completed: bool = False
 
@@ -81,7 +116,7 @@ class TutorialState:
             "lesson_id": self.lesson_id,
             "step_index": self.step_index,
             "graph_state": self.graph_state,
-            "completed_steps": self.completed_steps,
+            "completed_count": self.completed_count,
             "attempts": self.attempts,
             "completed": self.completed,
         }
@@ -93,15 +128,22 @@ class TutorialState:
             lesson_id=data["lesson_id"],
             step_index=data.get("step_index", 0),
             graph_state=data.get("graph_state", {}),
-            completed_steps=data.get("completed_steps", []),
+            # States saved before completed_count kept a list of step indices
+            completed_count=data.get(
+                "completed_count", len(data.get("completed_steps", ()))
+            ),
             attempts=data.get("attempts", 0),
             completed=data.get("completed", False),
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TutorialResponse:
-    """Response from processing user input."""
+    """Response from processing user input.
+
+    A response is built for nearly every keystroke and never changed once
+    returned, so it is slotted and immutable.
+    """
 
     success: bool
     message: str
@@ -1,44 +1,105 @@
 """Rich terminal rendering for tutorials."""
 
-from typing import Optional
+from __future__ import annotations
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+import functools
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Optional
 
 from backend.graph import CausalGraph
 from backend.rendering import render_graph_ascii
 from backend.tutorial.models import (
-    CausalLevel,
     Lesson,
     TutorialResponse,
     TutorialState,
     TutorialStep,
 )
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console, RenderableType
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+# Created on first render, so importing this module does not import Rich
+_console: Optional[Console] = None
+
+
+def _get_console() -> Console:
+    """Get the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def _literal(console: Console, text: str, style: str) -> Text:
+    """Style text without parsing it as markup.
+
+    It is highlighted the same way a printed string would be, so it looks
+    just like "[style]text[/style]" would, minus the risk of the text
+    itself containing tags.
+    """
+    rich_text = console.render_str(text, markup=False)
+    rich_text.stylize(style)
+    return rich_text
+
+
+def __getattr__(name: str) -> Any:
+    # Keeps the module-level `console` some callers expect
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Per-level tables, indexed by CausalLevel.value - 1 (levels are numbered 1-3)
+_LEVEL_MARKUP = (
+    "[green]1: Association[/green]",
+    "[yellow]2: Intervention[/yellow]",
+    "[red]3: Counterfactual[/red]",
+)
+_LEVEL_COLOR = ("green", "yellow", "red")
+
+# Every progress bar, indexed by how many of its cells are filled
+_BAR_WIDTH = 20
+_BARS = tuple(
+    f"[green]{'#' * filled}[/green][dim]{'-' * (_BAR_WIDTH - filled)}[/dim]"
+    for filled in range(_BAR_WIDTH + 1)
+)
 
 
 def render_welcome() -> None:
     """Render tutorial welcome message."""
-    console.print()
-    console.print(
-        Panel(
-            "[bold cyan]Archy Tutorial[/bold cyan]\n\n"
-            "Learn causal inference interactively!\n\n"
-            "[dim]Pearl's Causal Hierarchy:[/dim]\n"
-            "  [green]Level 1[/green]: Association - Understanding graphs\n"
-            "  [yellow]Level 2[/yellow]: Intervention - do-calculus\n"
-            "  [red]Level 3[/red]: Counterfactuals - What-if reasoning",
-            title="Welcome",
-            border_style="cyan",
-        )
+    from rich.console import Group
+
+    _get_console().print(Group("", _welcome_panel(), ""))
+
+
+@functools.cache
+def _welcome_panel() -> Panel:
+    """Build the welcome panel once; it has no per-call content."""
+    from rich.panel import Panel
+
+    return Panel(
+        "[bold cyan]Archy Tutorial[/bold cyan]\n\n"
+        "Learn causal inference interactively!\n\n"
+        "[dim]Pearl's Causal Hierarchy:[/dim]\n"
+        "  [green]Level 1[/green]: Association - Understanding graphs\n"
+        "  [yellow]Level 2[/yellow]: Intervention - do-calculus\n"
+        "  [red]Level 3[/red]: Counterfactuals - What-if reasoning",
+        title="Welcome",
+        border_style="cyan",
     )
-    console.print()
 
 
-def render_lesson_list(lessons: list[Lesson]) -> None:
+def render_lesson_list(lessons: Sequence[Lesson]) -> None:
     """Render available lessons as a table."""
+    from rich.console import Group
+    from rich.table import Table
+
+    console = _get_console()
     table = Table(title="Available Lessons", show_header=True)
     table.add_column("ID", style="cyan")
     table.add_column("Title", style="white")
@@ -46,67 +107,74 @@ def render_lesson_list(lessons: list[Lesson]) -> None:
     table.add_column("Requires", style="dim")
 
     for lesson in lessons:
-        level_str = {
-            CausalLevel.ASSOCIATION: "[green]1: Association[/green]",
-            CausalLevel.INTERVENTION: "[yellow]2: Intervention[/yellow]",
-            CausalLevel.COUNTERFACTUAL: "[red]3: Counterfactual[/red]",
-        }.get(lesson.level, str(lesson.level))
+        try:
+            level_str = _LEVEL_MARKUP[lesson.level.value - 1]
+        except IndexError:
+            level_str = str(lesson.level)
 
         prereq_str = ", ".join(lesson.prerequisites) if lesson.prerequisites else "-"
 
         table.add_row(lesson.id, lesson.title, level_str, prereq_str)
 
-    console.print(table)
-    console.print()
-    console.print("[dim]Start a lesson with:[/dim] archy learn <lesson-id>")
-    console.print()
+    console.print(
+        Group(table, "", "[dim]Start a lesson with:[/dim] archy learn <lesson-id>", "")
+    )
 
 
 def render_lesson_start(lesson: Lesson) -> None:
     """Render lesson introduction."""
-    level_color = {
-        CausalLevel.ASSOCIATION: "green",
-        CausalLevel.INTERVENTION: "yellow",
-        CausalLevel.COUNTERFACTUAL: "red",
-    }.get(lesson.level, "white")
+    from rich.console import Group
+    from rich.panel import Panel
 
-    console.print()
-    console.print(
-        Panel(
-            f"[bold]{lesson.title}[/bold]\n\n"
-            f"{lesson.description}\n\n"
-            f"[dim]Level {lesson.level.value}: {lesson.level.name.title()}[/dim]",
-            title=f"[{level_color}]Lesson[/{level_color}]",
-            border_style=level_color,
-        )
+    console = _get_console()
+    try:
+        level_color = _LEVEL_COLOR[lesson.level.value - 1]
+    except IndexError:
+        level_color = "white"
+
+    panel = Panel(
+        f"[bold]{lesson.title}[/bold]\n\n"
+        f"{lesson.description}\n\n"
+        f"[dim]Level {lesson.level.value}: {lesson.level.name.title()}[/dim]",
+        title=f"[{level_color}]Lesson[/{level_color}]",
+        border_style=level_color,
     )
-    console.print()
+    console.print(Group("", panel, ""))
 
 
 def render_step(step: TutorialStep, step_num: int, total_steps: int) -> None:
     """Render a tutorial step."""
-    console.print()
-    console.print(
+    from rich.console import Group
+
+    console = _get_console()
+    lines: list[RenderableType] = [
+        "",
         f"[dim]Step {step_num}/{total_steps}[/dim]",
-    )
-    console.print(f"[cyan]{step.instruction}[/cyan]")
-    console.print()
-    console.print(f"[bold white]{step.prompt}[/bold white]")
+        # Lesson text is shown as written, not parsed for markup
+        _literal(console, step.instruction, "cyan"),
+        "",
+        _literal(console, step.prompt, "bold white"),
+    ]
     if step.example:
-        console.print(f"[dim]Example: [green]{step.example}[/green][/dim]")
-    console.print()
+        lines.append(f"[dim]Example: [green]{step.example}[/green][/dim]")
+    lines.append("")
+    console.print(Group(*lines))
 
 
 def render_response(response: TutorialResponse) -> None:
     """Render tutorial response."""
-    if response.success:
-        console.print(f"[green]{response.message}[/green]")
-    else:
-        console.print(f"[red]{response.message}[/red]")
+    console = _get_console()
+    # Messages can echo user input and error text, so they are not markup
+    style = "green" if response.success else "red"
+    console.print(_literal(console, response.message, style))
 
 
 def render_graph(graph: Optional[CausalGraph]) -> None:
     """Render current graph state using the shared renderer."""
+    from rich.console import Group
+    from rich.panel import Panel
+
+    console = _get_console()
     if not graph:
         console.print("[dim]No graph yet.[/dim]")
         return
@@ -117,29 +185,38 @@ def render_graph(graph: Optional[CausalGraph]) -> None:
         console.print("[dim]Empty graph.[/dim]")
         return
 
-    console.print()
     diagram = render_graph_ascii(graph, use_rich=True)
-    console.print(Panel(diagram, title="[bold]Causal Graph[/bold]", border_style="dim"))
-    console.print()
+    panel = Panel(diagram, title="[bold]Causal Graph[/bold]", border_style="dim")
+    console.print(Group("", panel, ""))
 
 
 def render_lesson_complete(lesson: Lesson) -> None:
     """Render lesson completion message."""
-    console.print()
-    console.print(
-        Panel(
-            f"[bold green]Congratulations![/bold green]\n\n"
-            f"You completed: [cyan]{lesson.title}[/cyan]\n\n"
-            f"[dim]Continue learning with 'archy learn --list'[/dim]",
-            title="Lesson Complete",
-            border_style="green",
-        )
+    from rich.console import Group
+    from rich.panel import Panel
+
+    panel = Panel(
+        f"[bold green]Congratulations![/bold green]\n\n"
+        f"You completed: [cyan]{lesson.title}[/cyan]\n\n"
+        f"[dim]Continue learning with 'archy learn --list'[/dim]",
+        title="Lesson Complete",
+        border_style="green",
     )
-    console.print()
+    _get_console().print(Group("", panel, ""))
 
 
 def render_commands_help() -> None:
     """Render available commands during tutorial."""
+    from rich.console import Group
+
+    _get_console().print(Group(_commands_help_table(), ""))
+
+
+@functools.cache
+def _commands_help_table() -> Table:
+    """Build the commands table once; its rows never change."""
+    from rich.table import Table
+
     table = Table(title="Tutorial Commands", show_header=True)
     table.add_column("Command", style="cyan")
     table.add_column("Description", style="white")
@@ -162,30 +239,23 @@ def render_commands_help() -> None:
     for cmd, desc in commands:
         table.add_row(cmd, desc)
 
-    console.print(table)
-    console.print()
+    return table
 
 
 def render_progress(state: TutorialState, total_steps: int) -> None:
     """Render progress indicator."""
-    completed = len(state.completed_steps)
-    pct = int((completed / total_steps) * 100) if total_steps > 0 else 0
-    bar_width = 20
-    filled = int(bar_width * completed / total_steps) if total_steps > 0 else 0
-    bar = (
-        "[green]"
-        + "#" * filled
-        + "[/green]"
-        + "[dim]"
-        + "-" * (bar_width - filled)
-        + "[/dim]"
-    )
+    console = _get_console()
+    completed = state.completed_count
+    pct = completed * 100 // total_steps if total_steps > 0 else 0
+    filled = _BAR_WIDTH * completed // total_steps if total_steps > 0 else 0
+    bar = _BARS[min(filled, _BAR_WIDTH)]
 
     console.print(f"Progress: [{bar}] {pct}% ({completed}/{total_steps})")
 
 
 def get_prompt() -> str:
     """Get user input with prompt."""
+    console = _get_console()
     try:
         return console.input("[bold cyan]>[/bold cyan] ")
     except (EOFError, KeyboardInterrupt):
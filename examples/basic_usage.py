@@ -20,8 +20,8 @@ def example_basic_graph():
     print(f"Graph: {graph}")
     print(f"Nodes: {graph.get_nodes()}")
     print(f"Edges: {graph.get_edges()}")
-    print(f"Parents of Y: {graph.get_parents('Y')}")
-    print(f"Children of X: {graph.get_children('X')}")
+    print(f"Parents of Y: {sorted(graph.get_parents('Y'))}")
+    print(f"Children of X: {sorted(graph.get_children('X'))}")
 
     # Check d-separation
     # X and Z should be d-separated given Y (they're independent given Y)
@@ -46,7 +46,7 @@ def example_intervention():
 
     print("After do(Y) intervention:")
     print(f"  Remaining edges: {intervened.get_edges()}")
-    print(f"  Parents of Y: {intervened.get_parents('Y')} (should be empty)")
+    print(f"  Parents of Y: {sorted(intervened.get_parents('Y'))} (should be empty)")
 
 
 def example_do_calculus():
@@ -116,7 +116,7 @@ def example_counterfactual():
     print("\nCounterfactual question:")
     print("  'What would Y have been if X=2, given we observed X=1, Y=2?'")
 
-    # This is simplified - real counterfactuals need proper error abduction
+    # Abduction infers U = Y - 2*X = 0 from the evidence, then Y is recomputed
     result = scm.compute_counterfactual(
         intervention={"X": 2.0},
         factual_evidence={"X": 1.0, "Y": 2.0},
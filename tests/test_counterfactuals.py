@@ -0,0 +1,77 @@
+"""Tests for counterfactual abduction on a linear SCM."""
+
+import numpy as np
+import pytest
+
+from backend.counterfactuals import StructuralCausalModel, StructuralEquation
+from backend.graph import CausalGraph
+
+
+@pytest.fixture
+def model() -> StructuralCausalModel:
+    """W -> X -> Y <- Z, Y -> V, with additive errors.
+
+    Z has no equation (exogenous); W is never observed in the tests.
+    """
+    graph = CausalGraph(edges=[("W", "X"), ("X", "Y"), ("Z", "Y"), ("Y", "V")])
+    scm = StructuralCausalModel(graph)
+    scm.add_equation(
+        StructuralEquation(variable="W", function=lambda p, e: e, parents=[])
+    )
+    scm.add_equation(
+        StructuralEquation(variable="X", function=lambda p, e: p[0] + e, parents=["W"])
+    )
+    scm.add_equation(
+        StructuralEquation(
+            variable="Y",
+            function=lambda p, e: p[0] + p[1] + e,
+            batch_function=lambda p, e: p[0] + p[1] + e,
+            parents=["X", "Z"],
+        )
+    )
+    scm.add_equation(
+        StructuralEquation(
+            variable="V", function=lambda p, e: 2 * p[0] + e, parents=["Y"]
+        )
+    )
+    return scm
+
+
+def test_abduced_error_carries_into_counterfactual(model):
+    evidence = {"Z": 1.0, "X": 2.0, "Y": 3.5}
+    # U_Y = 3.5 - (2 + 1) = 0.5, so do(X=0) gives 0 + 1 + 0.5
+    assert model.compute_counterfactual({"X": 0.0}, evidence, "Y") == pytest.approx(1.5)
+
+
+def test_downstream_variable_is_recomputed(model):
+    evidence = {"Z": 1.0, "X": 2.0, "Y": 3.5, "V": 7.5}
+    # U_V = 7.5 - 2 * 3.5 = 0.5, and Y becomes 1.5 under do(X=0)
+    assert model.compute_counterfactual({"X": 0.0}, evidence, "V") == pytest.approx(3.5)
+
+
+def test_errors_of_unobserved_and_equationless_variables_are_zero(model):
+    errors = model._abduce_errors({"Z": 1.0, "X": 2.0, "Y": 3.5})
+    assert errors == pytest.approx({"W": 0.0, "X": 2.0, "Z": 0.0, "Y": 0.5, "V": 0.0})
+
+
+def test_batch_matches_scalar(model):
+    evidence = {
+        "Z": np.array([1.0, 0.0, 2.0]),
+        "X": np.array([2.0, 1.0, -1.0]),
+        "Y": np.array([3.5, 1.5, 0.0]),
+        "V": np.array([7.5, 3.4, 1.0]),
+    }
+    for query, expected in (("Y", [1.5, 0.5, 1.0]), ("V", [3.5, 1.4, 3.0])):
+        batch = model.compute_counterfactual_batch(
+            {"X": 0.0}, evidence, query, n_samples=3
+        )
+        np.testing.assert_allclose(batch, expected)
+        scalar = [
+            model.compute_counterfactual(
+                {"X": 0.0},
+                {var: float(vals[i]) for var, vals in evidence.items()},
+                query,
+            )
+            for i in range(3)
+        ]
+        np.testing.assert_allclose(batch, scalar)
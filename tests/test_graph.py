@@ -0,0 +1,40 @@
+"""Tests for CausalGraph backdoor-path queries."""
+
+from backend.graph import CausalGraph
+
+
+def test_confounder_backdoor_path():
+    graph = CausalGraph(edges=[("Z", "X"), ("Z", "Y"), ("X", "Y")])
+    assert graph.get_backdoor_paths("X", "Y") == [["X", "Z", "Y"]]
+    assert graph.has_backdoor_path("X", "Y")
+
+
+def test_longer_backdoor_path():
+    graph = CausalGraph(edges=[("W", "Z"), ("Z", "X"), ("W", "Y"), ("X", "Y")])
+    assert graph.get_backdoor_paths("X", "Y") == [["X", "Z", "W", "Y"]]
+
+
+def test_frontdoor_treatment_to_mediator_has_no_backdoor_path():
+    # Smoking <- U -> Cancer <- Tar: the only route back is through a collider
+    graph = CausalGraph(
+        edges=[("U", "Smoking"), ("U", "Cancer"), ("Smoking", "Tar"), ("Tar", "Cancer")]
+    )
+    assert graph.get_backdoor_paths("Smoking", "Tar") == []
+    assert not graph.has_backdoor_path("Smoking", "Tar")
+    assert graph.get_backdoor_paths("Smoking", "Cancer") == [["Smoking", "U", "Cancer"]]
+    assert graph.get_backdoor_paths("Tar", "Cancer") == [
+        ["Tar", "Smoking", "U", "Cancer"]
+    ]
+
+
+def test_m_bias_path_is_blocked_by_collider():
+    graph = CausalGraph(
+        edges=[("X", "Y"), ("A", "X"), ("A", "M"), ("B", "M"), ("B", "Y")]
+    )
+    assert graph.get_backdoor_paths("X", "Y") == []
+    assert not graph.has_backdoor_path("X", "Y")
+
+
+def test_no_backdoor_without_parents():
+    graph = CausalGraph(edges=[("X", "M"), ("M", "Y")])
+    assert graph.get_backdoor_paths("X", "Y") == []